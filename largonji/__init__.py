@@ -1,47 +1,77 @@
 """
 Louchébem - French Butcher's Argot Converter
 
-A hybrid implementation combining historical dictionary with algorithmic transformation.
+A hybrid implementation combining historical dictionary with algorithmic
+transformation.
+
+Submodules are loaded lazily (PEP 562): `import largonji` itself does no
+lexicon parsing or regex compilation; each attribute pulls in only the
+module that defines it, on first access.
 """
 
-from .config import LouchebemConfig
-from .converter import LouchebemConverter, convert
-from .lexicon import (
-    ESTABLISHED_LEXICON, 
-    STOPWORDS,
-    ULTRA_COMMON_VERBS,
-    INTERJECTIONS,
-)
-from .preservation import PreservationRules
-from .suffixes import (
-    select_suffix,
-    classify_consonant,
-    get_suffix_info,
-    SUFFIX_MAP,
-)
+import importlib
 
 __version__ = "0.1.0"
 
-__all__ = [
+# Maps each public attribute to the submodule that defines it
+_LAZY = {
     # Core converter
-    "LouchebemConverter",
-    "convert",
-    
+    "LouchebemConverter": "converter",
+    "convert": "converter",
+    "convert_batch": "converter",
+
     # Configuration
-    "LouchebemConfig",
-    
+    "LouchebemConfig": "config",
+    "PRESERVE_STOPWORDS": "config",
+    "PRESERVE_CASE": "config",
+    "PRESERVE_PUNCTUATION": "config",
+    "ENABLE_APOSTROPHE_MERGING": "config",
+    "ENABLE_SILENT_CONSONANTS": "config",
+    "ENABLE_DOUBLED_SIMPLIFICATION": "config",
+    "ENABLE_INFINITIVE_VERBS": "config",
+    "PRESERVE_ULTRA_COMMON_VERBS": "config",
+    "PRESERVE_INTERJECTIONS": "config",
+    "PRESERVE_NUMBERS": "config",
+    "PRESERVE_PROPER_NOUNS": "config",
+    "PRESERVE_ACRONYMS": "config",
+    "PRESERVE_ALREADY_LOUCHEBEM": "config",
+
     # Preservation
-    "PreservationRules",
-    
+    "PreservationRules": "preservation",
+
+    # Precompiled patterns
+    "NUMBER_RE": "_patterns",
+    "ROMAN_RE": "_patterns",
+    "ORDINAL_RE": "_patterns",
+
     # Data
-    "ESTABLISHED_LEXICON",
-    "STOPWORDS",
-    "ULTRA_COMMON_VERBS",
-    "INTERJECTIONS",
-    
+    "ESTABLISHED_LEXICON": "lexicon",
+    "STOPWORDS": "lexicon",
+    "ULTRA_COMMON_VERBS": "lexicon",
+    "INTERJECTIONS": "lexicon",
+    "LEXICON_TRIE": "lexicon",
+    "STOPWORD_TRIE": "lexicon",
+
     # Suffixes
-    "select_suffix",
-    "classify_consonant",
-    "get_suffix_info",
-    "SUFFIX_MAP",
-]
+    "select_suffix": "suffixes",
+    "classify_consonant": "suffixes",
+    "get_suffix_info": "suffixes",
+    "SUFFIX_MAP": "suffixes",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve public attributes lazily on first access (PEP 562)."""
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        # Cache on the package so subsequent accesses skip this hook
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,26 @@
+"""
+Precompiled regex patterns shared across the package.
+
+Compiling once at import skips the `re` module's internal cache lookup
+(and flag parsing) that every `re.match(pattern_string, ...)` call pays.
+All patterns here are anchored word-level tests used by the
+preservation rules.
+"""
+
+import re
+
+# Pure digits, including decimal/thousands punctuation: 1881, 1,000, 1.5
+NUMBER_RE = re.compile(r'^\d+([.,]\d+)*$')
+
+# Roman numerals, possibly with 'e'/'er' ordinal suffix: XVIII, XVIIIe, Ier
+ROMAN_RE = re.compile(r'^[IVXLCDM]+e?r?$', re.IGNORECASE)
+
+# Ordinal numbers: 1er, 2e, 3ème, 19e
+ORDINAL_RE = re.compile(r'^\d+(er|e|ème)$', re.IGNORECASE)
+
+# All number/date forms fused into one alternation so the hot path runs
+# a single pass through the regex engine instead of up to three
+NUMBER_OR_DATE_RE = re.compile(
+    r'^(?:\d+([.,]\d+)*|\d+(?:er|e|ème)|[IVXLCDM]+e?r?)$',
+    re.IGNORECASE,
+)
@@ -5,16 +5,37 @@ Provides a dataclass-based configuration system with feature flags
 and preservation options.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+# Bit values for LouchebemConfig.flags. Testing `config.flags & MASK` in a
+# hot loop is a single int AND instead of a boxed-bool attribute read.
+PRESERVE_STOPWORDS = 1 << 0
+PRESERVE_CASE = 1 << 1
+PRESERVE_PUNCTUATION = 1 << 2
+ENABLE_APOSTROPHE_MERGING = 1 << 3
+ENABLE_SILENT_CONSONANTS = 1 << 4
+ENABLE_DOUBLED_SIMPLIFICATION = 1 << 5
+ENABLE_INFINITIVE_VERBS = 1 << 6
+PRESERVE_ULTRA_COMMON_VERBS = 1 << 7
+PRESERVE_INTERJECTIONS = 1 << 8
+PRESERVE_NUMBERS = 1 << 9
+PRESERVE_PROPER_NOUNS = 1 << 10
+PRESERVE_ACRONYMS = 1 << 11
+PRESERVE_ALREADY_LOUCHEBEM = 1 << 12
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class LouchebemConfig:
     """
     Configuration for Louchébem converter behavior.
-    
+
     This allows fine-grained control over transformation features
     and word preservation rules.
+
+    Instances are frozen (immutable) and slotted: they can be hashed,
+    used as cache keys, and attribute reads skip the per-instance dict.
+    To derive a modified config, use `dataclasses.replace(config, ...)`.
     """
     
     # ===== Basic Options =====
@@ -63,53 +84,117 @@ class LouchebemConfig:
     
     preserve_already_louchebem: bool = True
     """Preserve words that look like Louchébem (avoid double-transformation)"""
-    
+
+    flags: int = field(init=False, default=0)
+    """Bitmask of all boolean options (see module-level bit constants)"""
+
+    _hash: int = field(init=False, default=0)
+    """Hash cached at construction (flags + seed capture the full state)"""
+
     def __post_init__(self):
-        """Validate configuration after initialization."""
+        """Validate configuration and precompute the flags bitmask."""
         # Ensure seed is None or a valid integer
         if self.random_seed is not None and not isinstance(self.random_seed, int):
             raise ValueError(f"random_seed must be None or int, got {type(self.random_seed)}")
+
+        # Pack the boolean options into one int so hot loops can test
+        # `flags & MASK` instead of doing an attribute read per option
+        flags = 0
+        if self.preserve_stopwords:
+            flags |= PRESERVE_STOPWORDS
+        if self.preserve_case:
+            flags |= PRESERVE_CASE
+        if self.preserve_punctuation:
+            flags |= PRESERVE_PUNCTUATION
+        if self.enable_apostrophe_merging:
+            flags |= ENABLE_APOSTROPHE_MERGING
+        if self.enable_silent_consonants:
+            flags |= ENABLE_SILENT_CONSONANTS
+        if self.enable_doubled_simplification:
+            flags |= ENABLE_DOUBLED_SIMPLIFICATION
+        if self.enable_infinitive_verbs:
+            flags |= ENABLE_INFINITIVE_VERBS
+        if self.preserve_ultra_common_verbs:
+            flags |= PRESERVE_ULTRA_COMMON_VERBS
+        if self.preserve_interjections:
+            flags |= PRESERVE_INTERJECTIONS
+        if self.preserve_numbers:
+            flags |= PRESERVE_NUMBERS
+        if self.preserve_proper_nouns:
+            flags |= PRESERVE_PROPER_NOUNS
+        if self.preserve_acronyms:
+            flags |= PRESERVE_ACRONYMS
+        if self.preserve_already_louchebem:
+            flags |= PRESERVE_ALREADY_LOUCHEBEM
+        # Frozen dataclass: bypass the frozen guard for the computed fields.
+        # flags + random_seed fully determine a config, so they are all
+        # the hash (and equality) need to look at.
+        object.__setattr__(self, 'flags', flags)
+        object.__setattr__(self, '_hash', hash((flags, self.random_seed)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        # Identity first: the canonical singletons and cached converters
+        # make `config is config` the common case
+        if self is other:
+            return True
+        if type(other) is not LouchebemConfig:
+            return NotImplemented
+        return self.flags == other.flags and self.random_seed == other.random_seed
     
     @classmethod
     def minimal(cls) -> 'LouchebemConfig':
         """
-        Create a minimal config that preserves only essential stopwords.
-        
+        Get the minimal config that preserves only essential stopwords.
+
         Returns:
             LouchebemConfig with most preservation features disabled
         """
-        return cls(
-            preserve_stopwords=True,
-            preserve_case=True,
-            preserve_punctuation=True,
-            preserve_ultra_common_verbs=False,
-            preserve_interjections=False,
-            preserve_numbers=False,
-            preserve_proper_nouns=False,
-            preserve_acronyms=False,
-            preserve_already_louchebem=False,
-        )
-    
+        return cls._MINIMAL
+
     @classmethod
     def maximal(cls) -> 'LouchebemConfig':
         """
-        Create a maximal config that preserves as much as possible.
-        
+        Get the maximal config that preserves as much as possible.
+
         Returns:
             LouchebemConfig with all preservation features enabled
         """
-        return cls()  # Default is already maximal
-    
+        return cls._MAXIMAL
+
     @classmethod
     def for_testing(cls, seed: int = 42) -> 'LouchebemConfig':
         """
         Create a config suitable for testing (with fixed seed).
-        
+
         Args:
             seed: Random seed for reproducible results
-            
+
         Returns:
             LouchebemConfig with deterministic behavior
         """
+        if seed == 42:
+            return cls._FOR_TESTING
         return cls(random_seed=seed)
 
+
+# Canonical configs, built once at import. Since configs are frozen, the
+# classmethods above can hand out these shared instances by reference —
+# no per-call dataclass construction, and pointer equality works for
+# cache lookups keyed on the config.
+LouchebemConfig._MINIMAL = LouchebemConfig(
+    preserve_stopwords=True,
+    preserve_case=True,
+    preserve_punctuation=True,
+    preserve_ultra_common_verbs=False,
+    preserve_interjections=False,
+    preserve_numbers=False,
+    preserve_proper_nouns=False,
+    preserve_acronyms=False,
+    preserve_already_louchebem=False,
+)
+LouchebemConfig._MAXIMAL = LouchebemConfig()  # Default is already maximal
+LouchebemConfig._FOR_TESTING = LouchebemConfig(random_seed=42)
+
@@ -10,14 +10,67 @@ Based on traditional louchébem rules where:
 - A suffix is added based on the final consonant sound
 """
 
+import functools
 import re
 
-from .config import LouchebemConfig
-from .lexicon import ESTABLISHED_LEXICON, get_louchebem_word
+from .config import LouchebemConfig, PRESERVE_STOPWORDS, PRESERVE_CASE
+from .lexicon import ESTABLISHED_LEXICON, MULTIWORD_STOPWORD_RE
 from .preservation import PreservationRules
 from .suffixes import select_suffix, classify_consonant
 
 
+# Code-point lookup table for tokenization: 1 for word characters
+# (ASCII letters, French accented letters, apostrophes), 0 otherwise.
+# Indexing a bytearray by code point replaces the regex engine's
+# 50-char character-class alternation with one array probe per char.
+_IS_WORD_CHAR = bytearray(1024)
+for _ch in ("abcdefghijklmnopqrstuvwxyz"
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            "àâäéèêëïîôùûüÿç"
+            "ÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ"
+            "'"):
+    _IS_WORD_CHAR[ord(_ch)] = 1
+del _ch
+
+# Token kinds emitted by _tokenize. Small-int tags compare with one
+# C-level comparison — no string hashing per token in the main loop
+TOKEN_WORD = 0
+TOKEN_OTHER = 1
+
+# Sentence-ending punctuation: one C-level isdisjoint probe per non-word
+# token replaces a Python-level any() generator over five membership scans
+_SENT_END = frozenset('.!?:;')
+
+
+# Doubled-consonant collapse: matches a repeated 'qu' or a repeated
+# single consonant (case-insensitively, so 'fF'/'Ff'/'FF' all match) and
+# keeps the first occurrence, preserving its casing.
+_DOUBLED_RE = re.compile(r'(qu)\1|([bcdfghjklmnpqrstvwxz])\2', re.IGNORECASE)
+
+
+def _build_silent_ending_tables(silent_endings: dict) -> tuple:
+    """
+    Precompute the silent-ending regex and replacement table.
+
+    Flattens the SILENT_ENDINGS dict into one anchored alternation
+    (longest patterns first, so '-ent' wins over '-et' on ambiguous
+    words) plus a pattern → drop-count map giving how many trailing
+    characters (the silent consonant) to cut. Stripping is a pure
+    truncation of the original word, so its casing survives intact;
+    the one rewrite ('-et' → 'è', preserving the /e/ sound) is
+    special-cased at the call site.
+    """
+    replacements = {}
+    for consonant, patterns in silent_endings.items():
+        for pattern in patterns:
+            if pattern in replacements:
+                continue
+            replacements[pattern] = len(consonant)
+    ordered = sorted(replacements, key=len, reverse=True)
+    regex = re.compile('(?:' + '|'.join(ordered) + ')$')
+    return regex, replacements
+
+
 class LouchebemConverter:
     """
     Convert French text to Louchébem using a hybrid approach.
@@ -30,8 +83,13 @@ class LouchebemConverter:
     5. Handles vowel-initial words by finding the first attack consonant
     """
     
-    # Simple vowels for detection (including accented)
-    VOWELS = 'aeiouyàâäéèêëïîôùûü'
+    # Simple vowels for detection (including accented). A frozenset makes
+    # membership tests O(1) hashes instead of linear scans over a str
+    VOWELS = frozenset('aeiouyàâäéèêëïîôùûü')
+
+    # Vowel classes driving the c/g orthographic adjustments
+    BACK_VOWELS = frozenset('aouàôù')
+    FRONT_VOWELS = frozenset('eéèêëiïî')
     
     # Nasal vowels and complex vowel patterns (treated as complete vowel sounds)
     # These are checked first before simple vowels
@@ -43,15 +101,12 @@ class LouchebemConverter:
     # Note: 'qu' is treated as a consonant cluster (u is part of the consonant)
     CONSONANT_PATTERN = re.compile(r'^(qu|[bcdfghjklmnpqrstvwxz]+)(.+)$', re.IGNORECASE)
     
-    # Pattern to find attack consonant in vowel-initial words
-    # Matches: vowel_sound + consonant_cluster + rest
-    # Note: 'qu' is treated as a consonant cluster (u is part of the consonant)
-    VOWEL_INITIAL_PATTERN = re.compile(
-        r'^([aeiouyàâäéèêëïîôùûü]+(?:n|m)?|an|en|in|on|un|ain|ein|oin|am|em|im|om|um|eau|au|eu|œu|ou|oi|ai|ei|ui)'
-        r'(qu|[bcdfghjklmnpqrstvwxz]+)'  # 'qu' is matched first as a unit
-        r'(.+)$', 
-        re.IGNORECASE
-    )
+    # Leading vowel run for vowel-initial words. The old single pattern
+    # ORed this with every nasal-vowel spelling, but the vowel-run branch
+    # subsumes them all, so splitting the match into "grab the vowel run,
+    # maybe absorb one nasal n/m, then reuse CONSONANT_PATTERN on the
+    # remainder" is deterministic and backtrack-free
+    LEADING_VOWEL_PATTERN = re.compile(r'^[aeiouyàâäéèêëïîôùûü]+', re.IGNORECASE)
     
     # Silent consonants at the end of French words
     # These are typically not pronounced and should be removed
@@ -64,7 +119,36 @@ class LouchebemConverter:
         'c': ['c'],  # blanc, franc
         'g': ['g', 'ng'],  # sang, long
     }
-    
+
+    # Flattened form of SILENT_ENDINGS: one anchored alternation plus a
+    # pattern → replacement map, built once at class-creation time
+    _SILENT_RE, _SILENT_REPLACEMENTS = _build_silent_ending_tables(SILENT_ENDINGS)
+
+    # Cheap pre-filter for the regex above: str.endswith with a tuple
+    # scans all candidate endings in C, so words without a silent ending
+    # (the majority) never invoke the regex engine at all
+    _SILENT_TUPLE = tuple(_SILENT_REPLACEMENTS)
+
+    # Phonetic-adjustment dispatch tables: (cluster, vowel class) → the
+    # rewritten cluster, replacing the if/elif cascades with dict probes
+    # and keeping the orthographic rules auditable in one place.
+    # 'back'/'front'/'other' refer to the vowel right after the cluster.
+    _ADJUST = {
+        ('c', 'back'): 'qu',   # c → qu to maintain [k] sound
+        ('c', 'front'): 'c',   # keep 'c' before e, i (becomes [s])
+        ('c', 'other'): 'c',
+        ('g', 'front'): 'gu',  # g → gu to maintain [g] sound
+        ('g', 'back'): 'g',
+        ('g', 'other'): 'g',
+    }
+
+    # Vowel-initial variant: all [k] spellings collapse to 'k', ss → s
+    _ADJUST_VOWEL_INITIAL = {
+        'ss': 's',
+        'c': 'k',
+        'ch': 'k',
+    }
+
     def __init__(
         self,
         config: LouchebemConfig | None = None,
@@ -95,76 +179,209 @@ class LouchebemConverter:
         
         self.config = config
         self.preservation_rules = PreservationRules(config)
-        
+
         # Expose commonly accessed config values as properties for convenience
         self.preserve_stopwords = config.preserve_stopwords
         self.preserve_case = config.preserve_case
         self.preserve_punctuation = config.preserve_punctuation
         self.random_seed = config.random_seed
+
+        # Packed bitmask of all boolean options: the per-word loop tests
+        # `self._flags & MASK` (one int AND) instead of attribute reads
+        self._flags = config.flags
+
+        # Flat lookup table of every word preserved by plain membership
+        # (stopwords, ultra-common verbs, interjections): one frozenset
+        # probe short-circuits the full preservation cascade. Contextual
+        # rules don't apply to these categories, so a hit is a hit
+        # regardless of sentence position. Empty when preservation is off.
+        if config.preserve_stopwords:
+            self._preserve_set = self.preservation_rules.all_preserved_words()
+        else:
+            self._preserve_set = frozenset()
+
+        # With a fixed seed, suffix selection is a pure function of the
+        # consonant cluster: memoize it per converter. French has only a
+        # few dozen distinct attack clusters, so the table saturates
+        # almost immediately. None in unseeded (random) mode.
+        self._suffix_table: dict[str, tuple[str, bool]] | None = (
+            {} if config.random_seed is not None else None
+        )
+
+        # Per-word memo: French text repeats words heavily (Zipf), so
+        # each distinct (word, sentence-start) pair is transformed once
+        self._word_cache: dict[tuple[str, bool], str] = {}
         
-    def convert_text(self, text: str) -> str:
+    def convert_text(self, text: str, return_stats: bool = False) -> str | tuple[str, dict]:
         """
         Convert a French text to Louchébem.
-        
+
         Args:
             text: Input French text
-            
+            return_stats: Also return conversion statistics, sparing
+                callers a second pass over the text just to count
+
         Returns:
-            Louchébem-transformed text
+            Louchébem-transformed text, or (text, stats) when
+            return_stats is True. The stats dict has 'words',
+            'preserved', 'transformed' and 'dict_hits' counts.
         """
         if not text:
+            if return_stats:
+                return text, {'words': 0, 'preserved': 0, 'transformed': 0, 'dict_hits': 0}
             return text
         
         # Split on word boundaries while preserving punctuation
         tokens = self._tokenize(text)
-        
+
+        # Bulk pre-pass: resolve the membership-only preservation fast
+        # path for the whole token stream in one comprehension — batched
+        # set probes instead of a Python-level check per loop iteration
+        preserve_set = self._preserve_set
+        preserved = [
+            kind == TOKEN_WORD and value.lower() in preserve_set
+            for kind, value in tokens
+        ]
+
+        # Multi-word stopwords ("de la", "il y a") span token boundaries
+        # and can never match a single token, so they are located on the
+        # raw text and their whole token ranges marked preserved. The
+        # tokens partition the text exactly, so running offsets line the
+        # two views up without storing per-token positions.
+        if (self._flags & PRESERVE_STOPWORDS and MULTIWORD_STOPWORD_RE is not None
+                and ' ' in text):
+            spans = [m.span() for m in MULTIWORD_STOPWORD_RE.finditer(text)]
+            if spans:
+                span_iter = iter(spans)
+                start, end = next(span_iter)
+                pos = 0
+                for i, (kind, value) in enumerate(tokens):
+                    tok_end = pos + len(value)
+                    if pos >= start and tok_end <= end:
+                        preserved[i] = True
+                    pos = tok_end
+                    if pos >= end:
+                        nxt = next(span_iter, None)
+                        if nxt is None:
+                            break
+                        start, end = nxt
+
         # Track sentence starts for proper noun detection
         is_sentence_start = True
-        sentence_end_punctuation = {'.', '!', '?', ':', ';'}
-        
-        # Convert each token
+
+        # Pre-bind hot attributes and constants to locals: each loop
+        # iteration then uses fast LOAD_FAST lookups instead of repeated
+        # attribute/global resolution
+        convert_word = self._convert_word
+        sent_end = _SENT_END
         converted = []
-        for token in tokens:
-            if token.get('type') == 'word':
-                word = token['value']
-                transformed = self._convert_word(word, is_sentence_start=is_sentence_start)
-                converted.append(transformed)
+        out_append = converted.append
+
+        # Convert each token
+        for i, (kind, value) in enumerate(tokens):
+            if kind == TOKEN_WORD:
+                if preserved[i]:
+                    transformed = value
+                else:
+                    transformed = convert_word(value, is_sentence_start=is_sentence_start)
+                out_append(transformed)
                 is_sentence_start = False  # Next word is not sentence start
             else:
                 # Preserve punctuation and whitespace
-                punct = token['value']
-                converted.append(punct)
+                out_append(value)
                 # Check if this punctuation ends a sentence
-                if any(p in punct for p in sentence_end_punctuation):
+                if not sent_end.isdisjoint(value):
                     is_sentence_start = True
-        
-        return ''.join(converted)
-    
-    def _tokenize(self, text: str) -> list[dict]:
+
+        result = ''.join(converted)
+        if not return_stats:
+            return result
+
+        # Stats are derived from the already-built parallel lists after
+        # the fact, so the hot conversion loop pays nothing for them
+        words = preserved_count = transformed = dict_hits = 0
+        for i, (kind, value) in enumerate(tokens):
+            if kind != TOKEN_WORD:
+                continue
+            words += 1
+            if preserved[i]:
+                preserved_count += 1
+            elif converted[i] != value:
+                transformed += 1
+            if value.lower() in ESTABLISHED_LEXICON:
+                dict_hits += 1
+        return result, {
+            'words': words,
+            'preserved': preserved_count,
+            'transformed': transformed,
+            'dict_hits': dict_hits,
+        }
+
+    def _tokenize(self, text: str) -> list[tuple[int, str]]:
         """
         Split text into words and non-words (punctuation, spaces).
-        
+
         Returns:
-            List of tokens with 'type' and 'value'
+            List of (kind, value) tuples, kind being TOKEN_WORD or
+            TOKEN_OTHER
         """
-        # Pattern: word characters (including French accents) vs non-word
-        pattern = re.compile(r"([a-zA-ZàâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ'']+|[^a-zA-ZàâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ'']+)")
-        
+        # Linear scan over code points against the _IS_WORD_CHAR table:
+        # accumulate maximal runs of same-class characters and slice each
+        # run out of the original string in one go
         tokens = []
-        for match in pattern.finditer(text):
-            token = match.group(1)
-            # Check if it's a word or punctuation/space
-            if re.match(r"[a-zA-ZàâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ'']+", token):
-                tokens.append({'type': 'word', 'value': token})
-            else:
-                tokens.append({'type': 'other', 'value': token})
-        
+        append = tokens.append
+        mask = _IS_WORD_CHAR
+        n = len(text)
+        i = 0
+        while i < n:
+            cp = ord(text[i])
+            in_word = cp < 1024 and bool(mask[cp])
+            j = i + 1
+            while j < n:
+                cp = ord(text[j])
+                if (cp < 1024 and bool(mask[cp])) != in_word:
+                    break
+                j += 1
+            append((TOKEN_WORD if in_word else TOKEN_OTHER, text[i:j]))
+            i = j
+
         return tokens
     
     def _convert_word(self, word: str, is_sentence_start: bool = False) -> str:
+        """
+        Convert a single word to Louchébem, memoized per converter.
+
+        Repeat words are served from the instance cache; see
+        _convert_word_uncached for the actual pipeline. Note that this
+        makes suffix choices stable per word within one converter.
+
+        Args:
+            word: A single French word
+            is_sentence_start: Whether this word starts a sentence
+
+        Returns:
+            The Louchébem transformation
+        """
+        # Fast path: words preserved by plain membership (stopwords etc.)
+        # come back unchanged, before any cache or pipeline work
+        if word.lower() in self._preserve_set:
+            return word
+
+        key = (word, is_sentence_start)
+        cached = self._word_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._convert_word_uncached(word, is_sentence_start)
+        # Bound the cache so pathological inputs can't grow it unchecked
+        if len(self._word_cache) < 65536:
+            self._word_cache[key] = result
+        return result
+
+    def _convert_word_uncached(self, word: str, is_sentence_start: bool = False) -> str:
         """
         Convert a single word to Louchébem (hybrid approach).
-        
+
         Handles French élisions (apostrophes):
         - l' + word: merge and transform (l'argot → largot → largonji)
         - Other apostrophes (d', j', s', etc.): preserve + transform word
@@ -180,63 +397,148 @@ class LouchebemConverter:
         if not word or len(word) < 2:
             return word
         
-        # Handle apostrophes (French élisions)
-        if "'" in word:
+        # Handle apostrophes (French élisions) in this frame: peel the
+        # élision prefixes off iteratively instead of recursing back
+        # through _convert_word, which would redo the apostrophe check
+        # and the preservation probe for every level
+        prefix = ''
+        while "'" in word and len(word) >= 2:
             before_apos, after_apos = word.split("'", 1)
-            
+
             # Special case: l' + word → merge them (l'argot → largot → largonji)
             # This makes phonetic sense since the word will start with 'l' anyway
             if before_apos.lower() == 'l':
                 # First check if the word after apostrophe is in dictionary (e.g., argot → largomuche)
-                lexicon_word = get_louchebem_word(after_apos)
+                # (lexicon keys are normalized at import, probe directly)
+                lexicon_word = ESTABLISHED_LEXICON.get(after_apos.lower())
                 if lexicon_word:
                     # Use the dictionary form (l'argot → largomuche)
                     if self.preserve_case:
-                        return self._apply_case_pattern(lexicon_word, word)
-                    return lexicon_word
-                
-                # Not in dictionary, merge l' with the word and transform as one
-                merged_word = 'l' + after_apos
-                return self._convert_word(merged_word, is_sentence_start)
-            
+                        return prefix + self._apply_case_pattern(lexicon_word, word)
+                    return prefix + lexicon_word
+
+                # Not in dictionary, merge l' with the word. A merged
+                # form with no further apostrophe can only be preserved
+                # as a plain-membership word or a Louchébem look-alike
+                # (it starts with lowercase 'l', so the number, acronym
+                # and proper-noun rules can never fire): check those two
+                # directly, probe the lexicon once, and jump straight to
+                # the algorithmic tail instead of re-running the full
+                # apostrophe and preservation machinery
+                merged = 'l' + after_apos
+                if "'" not in merged:
+                    merged_lower = merged.lower()
+                    if self._flags & PRESERVE_STOPWORDS and (
+                            merged_lower in self._preserve_set
+                            or (self.config.preserve_already_louchebem
+                                and self.preservation_rules.is_already_louchebem(merged_lower))):
+                        return prefix + merged
+                    lexicon_word = ESTABLISHED_LEXICON.get(merged_lower)
+                    if lexicon_word:
+                        if self._flags & PRESERVE_CASE:
+                            return prefix + self._apply_case_pattern(lexicon_word, merged)
+                        return prefix + lexicon_word
+                    return prefix + self._apply_algo(merged, merged, merged_lower)
+                word = merged
+
             # For other apostrophes (d', j', s', t', m', n', qu', c'):
             # Preserve the prefix and transform the word after
-            elif before_apos.lower() in ['d', 'j', 's', 't', 'm', 'n', 'qu', 'c']:
+            elif before_apos.lower() in ('d', 'j', 's', 't', 'm', 'n', 'qu', 'c'):
                 # Check if the word after apostrophe should be preserved
-                if self.preserve_stopwords and self.preservation_rules.should_preserve(after_apos, is_sentence_start):
+                if self._flags & PRESERVE_STOPWORDS and self.preservation_rules.should_preserve(after_apos, is_sentence_start):
                     # Both parts are stopwords, keep as-is
-                    return word
-                else:
-                    # Transform the word, keep the prefix
-                    transformed_after = self._convert_word(after_apos, is_sentence_start)
-                    # Preserve original case of the prefix
-                    return before_apos + "'" + transformed_after
-        
+                    return prefix + word
+                # Keep the prefix (original case) and continue on the rest
+                prefix += before_apos + "'"
+                word = after_apos
+
+            else:
+                # Apostrophe inside an unrecognized shape (aujourd'hui):
+                # leave it for the pipeline to handle as-is
+                break
+
+        # Re-check length: peeling can shrink the word (e.g. bare "l'")
+        if len(word) < 2:
+            return prefix + word
+
         # Remove apostrophes from the word (handle contractions)
         clean_word = word.strip("'")
-        
+        clean_lower = clean_word.lower()
+
         # Check if word should be preserved (using comprehensive preservation rules)
-        if self.preserve_stopwords and self.preservation_rules.should_preserve(clean_word, is_sentence_start):
-            return word
-        
-        # Check dictionary first (hybrid approach)
-        lexicon_word = get_louchebem_word(clean_word)
+        if self._flags & PRESERVE_STOPWORDS and self.preservation_rules.should_preserve(clean_word, is_sentence_start):
+            return prefix + word
+
+        # Check dictionary first (hybrid approach). The lexicon's keys
+        # are lowercased/NFC-normalized at import time, so one direct
+        # dict probe with the cached lowered word replaces the
+        # get_louchebem_word wrapper and its per-call .lower()
+        lexicon_word = ESTABLISHED_LEXICON.get(clean_lower)
         if lexicon_word:
             # Preserve original case pattern
-            if self.preserve_case:
-                return self._apply_case_pattern(lexicon_word, word)
-            return lexicon_word
-        
+            if self._flags & PRESERVE_CASE:
+                return prefix + self._apply_case_pattern(lexicon_word, word)
+            return prefix + lexicon_word
+
+        # Apply the algorithmic tail (silent consonants, infinitives,
+        # transformation) for unknown words
+        return prefix + self._apply_algo(clean_word, word, clean_lower)
+    
+    def _apply_algo(self, clean_word: str, original_word: str,
+                    clean_lower: str | None = None) -> str:
+        """
+        Run the algorithmic tail of the pipeline as one call.
+
+        Chains silent-consonant trimming, the -er → -é infinitive
+        rewrite and the Louchébem transformation, threading the lowered
+        form between stages. Entry point for every word that missed the
+        preservation rules and the lexicon.
+
+        Args:
+            clean_word: Word without surrounding apostrophes
+            original_word: Original word, kept for case restoration
+            clean_lower: Lowered form of clean_word, if already available
+
+        Returns:
+            Transformed word
+        """
+        if clean_lower is None:
+            clean_lower = clean_word.lower()
+
         # Remove silent ending consonants before transformation
-        clean_word = self._remove_silent_consonants(clean_word)
-        
+        clean_word, clean_lower = self._remove_silent_consonants(clean_word, clean_lower)
+
         # Handle infinitive verbs (-er → -é)
-        clean_word = self._handle_infinitive_verbs(clean_word)
-        
-        # Apply algorithmic transformation for unknown words
-        return self._apply_transformation(clean_word, word)
-    
-    def _remove_silent_consonants(self, word: str) -> str:
+        clean_word, clean_lower = self._handle_infinitive_verbs(clean_word, clean_lower)
+
+        return self._apply_transformation(clean_word, original_word, clean_lower)
+
+    def _select_suffix(self, consonants: str) -> tuple[str, bool]:
+        """
+        Select a suffix for the consonant cluster.
+
+        In seeded (deterministic) mode the choice depends only on the
+        cluster, so it is served from the per-converter table after the
+        first call. Unseeded mode delegates straight to select_suffix.
+
+        Args:
+            consonants: The adjusted attack consonant cluster
+
+        Returns:
+            Tuple of (suffix, needs_consonant)
+        """
+        table = self._suffix_table
+        if table is None:
+            return select_suffix(consonants)
+
+        key = consonants.lower()
+        cached = table.get(key)
+        if cached is None:
+            cached = select_suffix(consonants, seed=self.random_seed)
+            table[key] = cached
+        return cached
+
+    def _remove_silent_consonants(self, word: str, word_lower: str | None = None) -> tuple[str, str]:
         """
         Remove silent consonants at the end of French words.
         
@@ -249,41 +551,40 @@ class LouchebemConverter:
         
         Args:
             word: The word to process
+            word_lower: Lowered form of word, if the caller already has it
             
         Returns:
-            Word with silent consonants removed and accents adjusted
+            Tuple of (word, word_lower) with silent consonants removed
+            and accents adjusted — the lowered form is maintained in step
+            so callers never re-lower the whole word
         """
+        if word_lower is None:
+            word_lower = word.lower()
+
         if len(word) < 3:
-            return word
-        
-        word_lower = word.lower()
+            return word, word_lower
         
         # Special case: words ending in -ée should become -é
         # (The extra 'e' is silent/redundant)
         if word_lower.endswith('ée'):
-            return word[:-2] + 'é'
-        
-        # Check each type of silent ending
-        for consonant, patterns in self.SILENT_ENDINGS.items():
-            for pattern in patterns:
-                if word_lower.endswith(pattern):
-                    # Remove the silent consonant(s)
-                    cleaned = word[:-len(pattern)] + pattern[:-len(consonant)]
-                    
-                    # Special case: if word ends in "et" (like discret), 
-                    # change final "e" to "è" to preserve pronunciation
-                    if pattern == 'et' and len(cleaned) >= 2 and cleaned[-1] == 'e':
-                        cleaned = cleaned[:-1] + 'è'
-                    
-                    # Similar for "es", "ed", etc. ending in e
-                    elif pattern in ['es', 'ed'] and len(cleaned) >= 2 and cleaned[-1] == 'e':
-                        cleaned = cleaned[:-1] + 'è'
-                    
-                    return cleaned
-        
-        return word
+            return word[:-2] + 'é', word_lower[:-2] + 'é'
+        
+        # C-level tuple pre-filter, then a single regex probe over the
+        # flattened ending table; longest pattern wins. Only the silent
+        # consonant is dropped, by truncating the original-cased word
+        if word_lower.endswith(self._SILENT_TUPLE):
+            match = self._SILENT_RE.search(word_lower)
+            if match:
+                pattern = match.group(0)
+                if pattern == 'et':
+                    # Accent rewrite preserving the /e/ sound
+                    return word[:-2] + 'è', word_lower[:-2] + 'è'
+                drop = self._SILENT_REPLACEMENTS[pattern]
+                return word[:-drop], word_lower[:-drop]
+
+        return word, word_lower
     
-    def _handle_infinitive_verbs(self, word: str) -> str:
+    def _handle_infinitive_verbs(self, word: str, word_lower: str | None = None) -> tuple[str, str]:
         """
         Handle French infinitive verbs ending in -er.
         
@@ -296,28 +597,31 @@ class LouchebemConverter:
         
         Args:
             word: The word to process
+            word_lower: Lowered form of word, if the caller already has it
             
         Returns:
-            Word with -er changed to -é if applicable
+            Tuple of (word, word_lower) with -er changed to -é if applicable
         """
+        if word_lower is None:
+            word_lower = word.lower()
+
         if len(word) < 3:
-            return word
-        
-        word_lower = word.lower()
+            return word, word_lower
         
         # Check if word ends in -er (infinitive verb)
         if word_lower.endswith('er'):
             # Don't change if it's a short word or might not be a verb
             # (like "mer", "ver", "fer")
             if len(word) <= 3:
-                return word
+                return word, word_lower
             
             # Change -er to -é
-            return word[:-2] + 'é'
+            return word[:-2] + 'é', word_lower[:-2] + 'é'
         
-        return word
+        return word, word_lower
     
-    def _apply_transformation(self, clean_word: str, original_word: str) -> str:
+    def _apply_transformation(self, clean_word: str, original_word: str,
+                              clean_lower: str | None = None) -> str:
         """
         Apply the Louchébem transformation algorithm.
         
@@ -332,17 +636,34 @@ class LouchebemConverter:
         Args:
             clean_word: Word without punctuation
             original_word: Original word with original case
+            clean_lower: Lowered form of clean_word, if already available
             
         Returns:
             Transformed word
         """
+        if clean_lower is None:
+            clean_lower = clean_word.lower()
+
         # Check if word starts with a vowel
-        if clean_word[0].lower() in self.VOWELS:
-            # Try to find the attack consonant after the vowel sound
-            match = self.VOWEL_INITIAL_PATTERN.match(clean_word)
+        if clean_lower[0] in self.VOWELS:
+            # Grab the leading vowel run, then find the attack consonant
+            # in the remainder. A nasal n/m after the vowels belongs to
+            # the vowel sound ("entendre" → "en" + "t") — but only when a
+            # consonant cluster plus rest still follows it, mirroring the
+            # old pattern's optional-nasal backtracking ("ami" keeps its
+            # "m" as the attack consonant)
+            vowel_sound = self.LEADING_VOWEL_PATTERN.match(clean_word).group(0)
+            idx = len(vowel_sound)
+            match = None
+            if idx < len(clean_word) and clean_word[idx] in 'nmNM':
+                match = self.CONSONANT_PATTERN.match(clean_word[idx + 1:])
+                if match:
+                    vowel_sound = clean_word[:idx + 1]
+            if match is None:
+                match = self.CONSONANT_PATTERN.match(clean_word[idx:])
             if match:
-                vowel_sound, consonants, rest = match.groups()
-                
+                consonants, rest = match.groups()
+
                 # Make sure there's content after the consonants
                 if not rest:
                     return original_word
@@ -356,7 +677,7 @@ class LouchebemConverter:
                 )
                 
                 # Select suffix (returns suffix and whether consonant is needed)
-                suffix, needs_consonant = select_suffix(adjusted_consonants, seed=self.random_seed)
+                suffix, needs_consonant = self._select_suffix(adjusted_consonants)
                 
                 # Build word: check if suffix already contains the consonant
                 # Example: "entendre" → "en" + "l" + "endre" + "té" (té already has t)
@@ -372,7 +693,7 @@ class LouchebemConverter:
                 louchebem_word = self._simplify_doubled_consonants_in_word(louchebem_word)
                 
                 # Preserve case
-                if self.preserve_case:
+                if self._flags & PRESERVE_CASE:
                     return self._apply_case_pattern(louchebem_word, original_word)
                 
                 return louchebem_word
@@ -388,8 +709,9 @@ class LouchebemConverter:
         
         consonants, rest = match.groups()
         
-        # Make sure there's a vowel in the rest
-        if not any(c.lower() in self.VOWELS for c in rest):
+        # Make sure there's a vowel in the rest (single C-level set probe
+        # over the already-lowered tail, no per-char generator)
+        if self.VOWELS.isdisjoint(clean_lower[len(consonants):]):
             return original_word
         
         # Simplify doubled consonants (attention: tt → t)
@@ -399,7 +721,7 @@ class LouchebemConverter:
         adjusted_consonants = self._phonetic_adjust(consonants, rest)
         
         # Select appropriate suffix (returns suffix and whether consonant is needed)
-        suffix, needs_consonant = select_suffix(adjusted_consonants, seed=self.random_seed)
+        suffix, needs_consonant = self._select_suffix(adjusted_consonants)
         
         # Build word: check if suffix already contains the consonant
         # Special case: multi-character clusters (like "pr", "pl") must be kept in full
@@ -414,7 +736,7 @@ class LouchebemConverter:
         louchebem_word = self._simplify_doubled_consonants_in_word(louchebem_word)
         
         # Preserve case pattern from original
-        if self.preserve_case:
+        if self._flags & PRESERVE_CASE:
             return self._apply_case_pattern(louchebem_word, original_word)
         
         return louchebem_word
@@ -469,32 +791,11 @@ class LouchebemConverter:
         """
         if len(word) < 2:
             return word
-        
-        # First handle 'qu' doubling (ququ → qu)
-        # This needs to be done before single consonant doubling
-        result = word
-        result = result.replace('ququ', 'qu')
-        result = result.replace('QUQU', 'QU')
-        result = result.replace('QuQu', 'Qu')
-        result = result.replace('Ququ', 'Qu')
-        result = result.replace('quQu', 'qu')
-        
-        # Replace any doubled single consonants with single consonant
-        # We need to check each possible consonant
-        for consonant in 'bcdfghjklmnpqrstvwxz':
-            # Replace doubled (case-insensitive)
-            doubled_lower = consonant * 2
-            doubled_upper = consonant.upper() * 2
-            doubled_mixed1 = consonant + consonant.upper()
-            doubled_mixed2 = consonant.upper() + consonant
-            
-            # Replace all variations
-            result = result.replace(doubled_lower, consonant)
-            result = result.replace(doubled_upper, consonant.upper())
-            result = result.replace(doubled_mixed1, consonant)
-            result = result.replace(doubled_mixed2, consonant.upper())
-        
-        return result
+
+        # One regex pass: the 'qu' alternative is tried first so 'ququ'
+        # collapses as a unit, and keeping the matched first occurrence
+        # preserves its original casing ('Ff' → 'F', 'fF' → 'f')
+        return _DOUBLED_RE.sub(lambda m: m.group(1) or m.group(2), word)
     
     def _phonetic_adjust(self, consonants: str, rest: str) -> str:
         """
@@ -516,38 +817,26 @@ class LouchebemConverter:
         if not rest:
             return consonants
         
-        # Get the first character of rest (what comes after moved consonants)
+        # Classify the vowel right after the moved consonants, then
+        # resolve single-letter clusters through the dispatch table
         first_vowel = rest[0].lower()
         consonants_lower = consonants.lower()
-        consonants_upper = consonants.isupper()
-        
-        # Handle single 'c'
-        if consonants_lower == 'c':
-            if first_vowel in 'aouàôù':
-                # c → qu to maintain [k] sound
-                result = 'qu'
-            else:
-                # Keep 'c' before e, i (becomes [s])
-                result = 'c'
-            return result.upper() if consonants_upper else result
-        
-        # Handle single 'g'
-        if consonants_lower == 'g':
-            if first_vowel in 'eéèêëiïî':
-                # g → gu to maintain [g] sound
-                result = 'gu'
-            else:
-                result = 'g'
-            return result.upper() if consonants_upper else result
-        
-        # For clusters ending in c or g, apply similar rules
-        if consonants_lower.endswith('c'):
-            if first_vowel in 'aouàôù':
-                consonants = consonants[:-1] + 'qu'
+        if first_vowel in self.BACK_VOWELS:
+            vowel_class = 'back'
+        elif first_vowel in self.FRONT_VOWELS:
+            vowel_class = 'front'
+        else:
+            vowel_class = 'other'
+
+        adjusted = self._ADJUST.get((consonants_lower, vowel_class))
+        if adjusted is not None:
+            return adjusted.upper() if consonants.isupper() else adjusted
         
-        if consonants_lower.endswith('g'):
-            if first_vowel in 'eéèêëiïî':
-                consonants = consonants[:-1] + 'gu'
+        # For clusters ending in c or g, apply similar rules to the tail
+        if consonants_lower.endswith('c') and vowel_class == 'back':
+            return consonants[:-1] + 'qu'
+        if consonants_lower.endswith('g') and vowel_class == 'front':
+            return consonants[:-1] + 'gu'
         
         return consonants
     
@@ -577,20 +866,13 @@ class LouchebemConverter:
             # Check if we're between vowels (vowel before, vowel after)
             if rest and rest[0].lower() in self.VOWELS:
                 # s between vowels → z (for [z] sound)
-                result = 'z'
-                return result.upper() if consonants_upper else result
-        
-        # Handle 'ss' → 's' (always [s] sound, not [z])
-        if consonants_lower == 'ss':
-            result = 's'
-            return result.upper() if consonants_upper else result
+                return 'Z' if consonants_upper else 'z'
         
-        # Handle 'c' and 'ch' variants for [k] sound → 'k'
-        # Note: 'qu' is kept as-is (don't drop the 'u')
-        if consonants_lower in ['c', 'ch']:
-            # According to rules: [k] variants → 'k'
-            result = 'k'
-            return result.upper() if consonants_upper else result
+        # Dispatch-table rewrites: ss → s, and the [k] variants c/ch → k
+        # ('qu' is deliberately absent — it keeps its 'u')
+        adjusted = self._ADJUST_VOWEL_INITIAL.get(consonants_lower)
+        if adjusted is not None:
+            return adjusted.upper() if consonants_upper else adjusted
         
         # Keep 'qu' as-is (don't convert to 'k', preserve the 'u')
         if consonants_lower == 'qu':
@@ -623,28 +905,28 @@ class LouchebemConverter:
         """
         if not transformed or not original:
             return transformed
-        
+
+        # All lowercase — by far the most common shape in running text,
+        # so it is checked first
+        if original.islower():
+            return transformed.lower()
+
         # All uppercase
         if original.isupper():
             return transformed.upper()
-        
-        # All lowercase
-        if original.islower():
-            return transformed.lower()
-        
+
         # Title case (first letter capital)
         if original[0].isupper() and (len(original) == 1 or original[1:].islower()):
             return transformed.capitalize()
-        
-        # Mixed case - do best effort
-        # Apply pattern character by character where possible
-        result = list(transformed.lower())
-        for i, char in enumerate(original):
-            if i < len(result):
-                if char.isupper():
-                    result[i] = result[i].upper()
-        
-        return ''.join(result)
+
+        # Mixed case - do best effort: uppercase each position where the
+        # original had an uppercase letter (indices beyond the original
+        # stay lowercase)
+        original_len = len(original)
+        return ''.join(
+            ch.upper() if i < original_len and original[i].isupper() else ch
+            for i, ch in enumerate(transformed.lower())
+        )
     
     def get_transformation_info(self, word: str, is_sentence_start: bool = False) -> dict:
         """
@@ -683,19 +965,58 @@ class LouchebemConverter:
         return info
 
 
+@functools.lru_cache(maxsize=8)
+def _get_converter(config: LouchebemConfig) -> LouchebemConverter:
+    """Get (or lazily build) a shared converter for the given config."""
+    return LouchebemConverter(config)
+
+
 # Convenience function for quick conversions
+@functools.lru_cache(maxsize=1024)
 def convert(text: str) -> str:
     """
     Quick conversion function (hybrid mode).
-    
+
     Uses dictionary lookup for known words, algorithmic transformation for unknown words.
-    
+
+    Results are memoized with an LRU cache (repeat calls with the same
+    text return the cached — hence identical — output instead of
+    re-rolling random suffixes). Use ``convert.cache_clear()`` to reset.
+
     Args:
         text: French text to convert
-        
+
     Returns:
         Louchébem text
     """
-    converter = LouchebemConverter()
-    return converter.convert_text(text)
+    return _get_converter(LouchebemConfig()).convert_text(text)
+
+
+def convert_batch(words, config: LouchebemConfig | None = None) -> list[str]:
+    """
+    Convert a sequence of single words in one call (corpus workloads).
+
+    Amortizes setup across the whole batch: one shared converter, and a
+    local memo so each distinct word is transformed exactly once —
+    with Zipfian word distributions the bulk of the batch becomes dict
+    probes. Words are treated as standalone (no sentence context).
+
+    Args:
+        words: Sequence of French words to convert
+        config: Optional configuration (defaults to standard hybrid mode)
+
+    Returns:
+        List of Louchébem words, aligned with the input
+    """
+    converter = _get_converter(config if config is not None else LouchebemConfig())
+    convert_word = converter._convert_word
+    memo: dict[str, str] = {}
+    result = []
+    for word in words:
+        transformed = memo.get(word)
+        if transformed is None:
+            transformed = convert_word(word)
+            memo[word] = transformed
+        result.append(transformed)
+    return result
 
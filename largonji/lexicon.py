@@ -12,6 +12,11 @@ This module contains:
 Note: Preservation logic has been moved to preservation.py
 """
 
+import re
+import sys
+import types
+import unicodedata
+
 # Core established Louchébem vocabulary
 ESTABLISHED_LEXICON = {
     # The word that gave its name to the argot
@@ -164,7 +169,9 @@ ESTABLISHED_LEXICON = {
 
 # Ultra-common verbs that should be preserved for readability
 # These verbs are so frequent that transforming them hurts comprehension
-ULTRA_COMMON_VERBS = {
+# (declared frozen: immutable sets let the interpreter specialize the
+# membership op and are safe to share across threads)
+ULTRA_COMMON_VERBS = frozenset({
     # être (to be) - all forms
     'être', 'suis', 'es', 'est', 'sommes', 'êtes', 'sont',
     'étais', 'était', 'étions', 'étiez', 'étaient',
@@ -200,11 +207,11 @@ ULTRA_COMMON_VERBS = {
     'irais', 'irait', 'irions', 'iriez', 'iraient',
     'aille', 'ailles', 'aillent',
     'allé', 'allée', 'allés', 'allées', 'allant',
-}
+})
 
 # Interjections and onomatopoeia that should be preserved
 # These express emotion/sound and should stay natural
-INTERJECTIONS = {
+INTERJECTIONS = frozenset({
     # Basic interjections
     'ah', 'oh', 'eh', 'hé', 'hein', 'euh', 'ouh',
     'aïe', 'ouille', 'aïe', 'ouf', 'oof',
@@ -221,11 +228,11 @@ INTERJECTIONS = {
     
     # Exclamations
     'hélas', 'tant pis', 'tant mieux',
-}
+})
 
 # French stopwords that should NOT be transformed
 # (articles, prepositions, pronouns, etc.)
-STOPWORDS = {
+STOPWORDS = frozenset({
     # Articles
     'le', 'la', 'les', "l'",
     'un', 'une', 'des',
@@ -275,7 +282,70 @@ STOPWORDS = {
     # Contractions
     "j'", "t'", "s'", "c'", "d'", "l'", "m'", "n'",
     "qu'", "jusqu'", "lorsqu'", "puisqu'",
+})
+
+def _normalize_key(word: str) -> str:
+    """Normalize a lexicon key: NFC composition + lowercase."""
+    return unicodedata.normalize('NFC', word).lower()
+
+
+# Freeze the word collections and intern their strings once at import.
+# Keys are pre-normalized (NFC + lowercase) here so lookups never pay
+# unicodedata.normalize at runtime — a plain .lower() on NFC input text
+# is enough to hit them. Interned strings hit CPython's identity fast
+# path inside set/dict lookups, and frozensets hash their elements
+# exactly once. These collections must be treated as immutable.
+_ESTABLISHED_LEXICON_RAW = {
+    sys.intern(_normalize_key(k)): sys.intern(v)
+    for k, v in ESTABLISHED_LEXICON.items()
 }
+# Read-only view: the lexicon is fully static, so publishing it behind a
+# MappingProxyType makes accidental mutation impossible while keeping
+# dict-speed .get()/`in` on the underlying table
+ESTABLISHED_LEXICON = types.MappingProxyType(_ESTABLISHED_LEXICON_RAW)
+STOPWORDS = frozenset(sys.intern(_normalize_key(w)) for w in STOPWORDS)
+ULTRA_COMMON_VERBS = frozenset(sys.intern(_normalize_key(w)) for w in ULTRA_COMMON_VERBS)
+INTERJECTIONS = frozenset(sys.intern(_normalize_key(w)) for w in INTERJECTIONS)
+
+# Multi-token stopwords ("de la", "il y a") can never match a single
+# token, so per-word membership tests use the single-word subset only.
+# The phrases get a compiled alternation (longest first, so "il y a"
+# wins over a hypothetical "il y" prefix) that the converter matches
+# against the raw text before word-splitting.
+SINGLE_STOPWORDS = frozenset(w for w in STOPWORDS if ' ' not in w)
+MULTIWORD_STOPWORDS = tuple(
+    sorted((w for w in STOPWORDS if ' ' in w), key=len, reverse=True)
+)
+MULTIWORD_STOPWORD_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, MULTIWORD_STOPWORDS)) + r')\b',
+    re.IGNORECASE,
+) if MULTIWORD_STOPWORDS else None
+
+# Two-tier stopword split along Zipf's law: the couple of dozen words
+# below dominate French token frequency, so probing their tiny frozenset
+# first keeps the common case in a small, hot hash table and the full
+# set is only reached for the long tail.
+TIER1_STOPWORDS = frozenset({
+    'de', 'le', 'la', 'les', 'et', 'à', 'un', 'une', 'du', 'des',
+    'en', 'que', 'qui', 'ce', 'il', 'je', 'tu', 'dans', 'pour',
+    'pas', 'ne', 'se', 'on', 'son', 'sa',
+}) & SINGLE_STOPWORDS
+TIER2_STOPWORDS = SINGLE_STOPWORDS - TIER1_STOPWORDS
+
+
+# Static membership structures for fast lookups.
+# When marisa-trie is installed, build memory-compact tries (O(len(word))
+# lookups, plus prefix queries); otherwise fall back to plain frozensets,
+# which offer the same `word in ...` interface.
+try:
+    from marisa_trie import Trie as _Trie
+
+    LEXICON_TRIE = _Trie(ESTABLISHED_LEXICON.keys())
+    STOPWORD_TRIE = _Trie(STOPWORDS)
+except ImportError:
+    LEXICON_TRIE = frozenset(ESTABLISHED_LEXICON)
+    STOPWORD_TRIE = frozenset(STOPWORDS)
+
 
 # Simple lookup function
 def get_louchebem_word(word: str) -> str | None:
@@ -11,13 +11,250 @@ Determines which words should NOT be transformed, including:
 - Words already in Louchébem
 """
 
-import re
-from .config import LouchebemConfig
+import functools
+import sys
+
+from ._patterns import NUMBER_OR_DATE_RE
+from .config import (
+    LouchebemConfig,
+    PRESERVE_STOPWORDS,
+    PRESERVE_ULTRA_COMMON_VERBS,
+    PRESERVE_INTERJECTIONS,
+    PRESERVE_NUMBERS,
+    PRESERVE_PROPER_NOUNS,
+    PRESERVE_ACRONYMS,
+    PRESERVE_ALREADY_LOUCHEBEM,
+)
 from .lexicon import (
-    STOPWORDS,
+    SINGLE_STOPWORDS,
+    TIER1_STOPWORDS,
+    TIER2_STOPWORDS,
     ULTRA_COMMON_VERBS,
     INTERJECTIONS,
 )
+from .suffixes import is_louchebem_like
+
+
+# Bound method reference: one LOAD_GLOBAL per call instead of a module
+# attribute plus a method lookup on the compiled pattern
+_NUMBER_MATCH = NUMBER_OR_DATE_RE.match
+
+# Punctuation stripped off words before the contextual predicates run
+_STRIP_CHARS = "'\".,;:!?"
+
+# Merged category table (gperf-style static lookup): one dict probe
+# answers both "is this word in any of the flat preservation sets" and
+# "which ones", replacing up to three separate frozenset tests per word.
+# Tags are OR-able bits because a few words live in more than one set
+# ('allez' is both a verb form and an interjection).
+_TAG_STOPWORD = 1
+_TAG_VERB = 2
+_TAG_INTERJECTION = 4
+
+_CATEGORY: dict[str, int] = {}
+for _word_set, _tag in ((SINGLE_STOPWORDS, _TAG_STOPWORD),
+                        (ULTRA_COMMON_VERBS, _TAG_VERB),
+                        (INTERJECTIONS, _TAG_INTERJECTION)):
+    for _w in _word_set:
+        _CATEGORY[_w] = _CATEGORY.get(_w, 0) | _tag
+del _word_set, _tag, _w
+
+
+# First-character gate: a 256-entry LUT mapping a word's first code point
+# to the preservation categories it could possibly match. Numbers must
+# start with a digit or Roman-numeral letter, proper nouns with an
+# uppercase letter, Louchébem words with 'l' — one tuple index replaces
+# an isdigit()/isupper() call cascade per word. Leading punctuation (the
+# chars the predicates strip) can hide anything, so it keeps all bits.
+_GATED_CATEGORIES = PRESERVE_NUMBERS | PRESERVE_PROPER_NOUNS | PRESERVE_ALREADY_LOUCHEBEM
+
+
+def _first_char_flags(ch: str) -> int:
+    if ch in "'\".,;:!?":
+        return _GATED_CATEGORIES
+    flags = 0
+    if ch.isdigit() or ch.upper() in 'IVXLCDM':
+        flags |= PRESERVE_NUMBERS
+    if ch.isupper():
+        flags |= PRESERVE_PROPER_NOUNS
+    if ch in 'lL':
+        flags |= PRESERVE_ALREADY_LOUCHEBEM
+    return flags
+
+
+_FIRST_CHAR_LUT = tuple(_first_char_flags(chr(i)) for i in range(256))
+
+
+# ============================================================================
+# PREDICATES
+# Plain module-level functions: none of them touch instance or class
+# state, so keeping them out of the class avoids descriptor lookup and
+# bound-method construction on hot call paths. PreservationRules binds
+# them as staticmethods below for API compatibility.
+# ============================================================================
+
+def _is_acronym_norm(word: str, word_clean: str) -> bool:
+    """Acronym check over the pre-stripped form (see _is_acronym)."""
+    if '.' not in word:
+        # Only the all-uppercase rule (SNCF, NATO, FBI) can apply;
+        # a lowercase first character settles it immediately
+        return (len(word_clean) >= 2
+                and not word_clean[0].islower()
+                and word_clean.isupper())
+
+    # Dotted abbreviation (M., Mme., Dr.): count non-dot characters
+    # and track case in one pass instead of allocating a dot-free
+    # copy and scanning again with isupper()
+    non_dots = 0
+    has_upper = False
+    has_lower = False
+    for ch in word_clean:
+        if ch == '.':
+            continue
+        non_dots += 1
+        if ch.isupper():
+            has_upper = True
+        elif ch.islower():
+            has_lower = True
+    if non_dots <= 4:
+        return True
+
+    # All uppercase (2+ letters), dots and digits don't count
+    return len(word_clean) >= 2 and has_upper and not has_lower
+
+
+def _is_already_louchebem_norm(word_lower: str) -> bool:
+    """Louchébem-shape check over the pre-normalized form."""
+    # Must start with 'l' (but not la/le/les/l')
+    if not word_lower.startswith('l') or len(word_lower) < 4:
+        return False
+
+    # Skip obvious articles
+    if word_lower in {'le', 'la', 'les', 'leur', 'leurs'}:
+        return False
+
+    return is_louchebem_like(word_lower)
+
+
+def _is_stopword(word: str) -> bool:
+    """
+    Check if a word is a stopword (article, preposition, pronoun, etc.).
+
+    Args:
+        word: The word to check
+
+    Returns:
+        True if word is a stopword
+    """
+    # Two-tier probe: the tiny tier-1 set catches the Zipfian head of
+    # French token frequency before touching the full table
+    w = word.lower().strip("'\"")
+    return w in TIER1_STOPWORDS or w in TIER2_STOPWORDS
+
+
+def _is_ultra_common_verb(word: str) -> bool:
+    """
+    Check if a word is an ultra-common verb form (être, avoir, faire, aller).
+
+    These verbs are so frequent that transforming them hurts comprehension.
+
+    Args:
+        word: The word to check
+
+    Returns:
+        True if word is an ultra-common verb form
+    """
+    return word.lower().strip("'\"") in ULTRA_COMMON_VERBS
+
+
+def _is_interjection(word: str) -> bool:
+    """
+    Check if a word is an interjection or onomatopoeia.
+
+    These express emotion/sound and should stay natural.
+
+    Args:
+        word: The word to check
+
+    Returns:
+        True if word is an interjection
+    """
+    return word.lower().strip("'\"!?,;:.") in INTERJECTIONS
+
+
+def _is_number_or_date(word: str) -> bool:
+    """
+    Check if a word is a digit, Roman numeral, or date-related number.
+
+    Examples: 1881, XVIIIe, XIXe, 19e, 1er, etc.
+
+    Args:
+        word: The word to check
+
+    Returns:
+        True if word is a number or date
+    """
+    word_clean = word.strip("'\".,;:!?")
+
+    # One fused alternation covers pure digits (1881, 1,000, 1.5),
+    # ordinals (1er, 19e, 3ème) and Roman numerals (XVIII, XVIIIe, Ier)
+    return _NUMBER_MATCH(word_clean) is not None
+
+
+def _is_acronym(word: str) -> bool:
+    """
+    Check if a word is an acronym.
+
+    Examples: SNCF, M., Mme, Dr., etc.
+
+    Args:
+        word: The word to check
+
+    Returns:
+        True if word is an acronym
+    """
+    return _is_acronym_norm(word, word.strip(_STRIP_CHARS))
+
+
+def _is_proper_noun(word: str, is_sentence_start: bool = False) -> bool:
+    """
+    Check if a word is likely a proper noun (name, place, etc.).
+
+    Args:
+        word: The word to check
+        is_sentence_start: Whether this word starts a sentence
+
+    Returns:
+        True if the word is capitalized and NOT at sentence start
+    """
+    # Don't flag sentence-initial words as proper nouns
+    if is_sentence_start:
+        return False
+
+    # Scan past any opening quotes/punctuation and test the first
+    # real character in place — no stripped copy just to look at
+    # its case
+    for ch in word:
+        if ch in _STRIP_CHARS:
+            continue
+        return ch.isupper()
+    return False
+
+
+def _is_already_louchebem(word: str) -> bool:
+    """
+    Check if a word looks like it's already in Louchébem form.
+
+    Louchébem pattern: starts with 'l', ends with typical suffixes.
+    Examples: loucherbem, largonji, laféquès, lombem, etc.
+
+    Args:
+        word: The word to check
+
+    Returns:
+        True if word looks like Louchébem
+    """
+    return _is_already_louchebem_norm(word.lower().strip(_STRIP_CHARS))
 
 
 class PreservationRules:
@@ -35,12 +272,47 @@ class PreservationRules:
             config: Configuration controlling which rules are active
         """
         self.config = config
+
+        # Specialized predicate compiled for this exact flag set: only
+        # the branches the config enables exist in its bytecode (see
+        # _compile_preserve_predicate). Shared across instances with the
+        # same flags via the factory's cache.
+        self._should_preserve_uncached = _compile_preserve_predicate(config.flags)
+
+        # Per-rules memo for should_preserve: Zipfian repetition means
+        # most calls are repeats, served as one dict probe. Keyed on the
+        # raw (word, sentence-start) pair since case and position both
+        # affect the outcome.
+        self._preserve_cache: dict[tuple[str, bool], bool] = {}
     
+    def all_preserved_words(self) -> frozenset:
+        """
+        Collect every word the active config preserves by plain lookup.
+
+        Covers the flat-set categories (stopwords, ultra-common verbs,
+        interjections) that depend only on the word itself — not the
+        contextual rules (numbers, acronyms, proper nouns, Louchébem
+        shape). Useful for building fast-path membership tables.
+
+        Returns:
+            Frozenset of lowercased preserved words
+        """
+        words = set()
+        if self.config.preserve_stopwords:
+            words |= SINGLE_STOPWORDS
+        if self.config.preserve_ultra_common_verbs:
+            words |= ULTRA_COMMON_VERBS
+        if self.config.preserve_interjections:
+            words |= INTERJECTIONS
+        return frozenset(words)
+
     def should_preserve(self, word: str, is_sentence_start: bool = False) -> bool:
         """
         Master check: should this word be preserved?
         
         Checks all active preservation rules based on configuration.
+        Results are memoized per instance; the rule cascade itself is
+        compiled per flag set (see _compile_preserve_predicate).
         
         Args:
             word: The word to check
@@ -49,248 +321,162 @@ class PreservationRules:
         Returns:
             True if word should be preserved, False if it should be transformed
         """
-        # Always check stopwords (if enabled in config)
-        if self.config.preserve_stopwords and self.is_stopword(word):
-            return True
-        
-        # Check each category based on config
-        if self.config.preserve_ultra_common_verbs and self.is_ultra_common_verb(word):
-            return True
-        
-        if self.config.preserve_interjections and self.is_interjection(word):
-            return True
-        
-        if self.config.preserve_numbers and self.is_number_or_date(word):
-            return True
-        
-        if self.config.preserve_acronyms and self.is_acronym(word):
-            return True
-        
-        if self.config.preserve_proper_nouns and self.is_proper_noun(word, is_sentence_start):
-            return True
-        
-        if self.config.preserve_already_louchebem and self.is_already_louchebem(word):
-            return True
-        
-        return False
-    
-    @staticmethod
-    def is_stopword(word: str) -> bool:
-        """
-        Check if a word is a stopword (article, preposition, pronoun, etc.).
-        
-        Args:
-            word: The word to check
-            
-        Returns:
-            True if word is a stopword
-        """
-        return word.lower().strip("'\"") in STOPWORDS
-    
-    @staticmethod
-    def is_ultra_common_verb(word: str) -> bool:
-        """
-        Check if a word is an ultra-common verb form (être, avoir, faire, aller).
-        
-        These verbs are so frequent that transforming them hurts comprehension.
-        
-        Args:
-            word: The word to check
-            
-        Returns:
-            True if word is an ultra-common verb form
-        """
-        return word.lower().strip("'\"") in ULTRA_COMMON_VERBS
-    
-    @staticmethod
-    def is_interjection(word: str) -> bool:
-        """
-        Check if a word is an interjection or onomatopoeia.
-        
-        These express emotion/sound and should stay natural.
-        
-        Args:
-            word: The word to check
-            
-        Returns:
-            True if word is an interjection
-        """
-        return word.lower().strip("'\"!?,;:.") in INTERJECTIONS
-    
-    @staticmethod
-    def is_number_or_date(word: str) -> bool:
-        """
-        Check if a word is a digit, Roman numeral, or date-related number.
-        
-        Examples: 1881, XVIIIe, XIXe, 19e, 1er, etc.
-        
-        Args:
-            word: The word to check
-            
-        Returns:
-            True if word is a number or date
-        """
-        word_clean = word.strip("'\".,;:!?")
-        
-        # Pure digits (including with punctuation like 1,000 or 1.5)
-        if re.match(r'^\d+([.,]\d+)*$', word_clean):
-            return True
-        
-        # Roman numerals (possibly with 'e' or 'er' suffix for ordinals)
-        # Matches: XVIII, XVIIIe, XIXe, Ier, IIe, etc.
-        if re.match(r'^[IVXLCDM]+e?r?$', word_clean, re.IGNORECASE):
-            return True
-        
-        # Ordinal numbers: 1er, 2e, 3ème, 19e, etc.
-        if re.match(r'^\d+(er|e|ème)$', word_clean, re.IGNORECASE):
-            return True
-        
-        return False
-    
-    @staticmethod
-    def is_acronym(word: str) -> bool:
-        """
-        Check if a word is an acronym.
-        
-        Examples: SNCF, M., Mme, Dr., etc.
-        
-        Args:
-            word: The word to check
-            
-        Returns:
-            True if word is an acronym
-        """
-        word_clean = word.strip("'\".,;:!?")
-        
-        # All uppercase (2+ letters): SNCF, NATO, FBI
-        if len(word_clean) >= 2 and word_clean.isupper():
-            return True
-        
-        # Abbreviations with dots: M., Mme., Dr., etc.
-        if '.' in word and len(word_clean.replace('.', '')) <= 4:
-            return True
-        
-        return False
-    
-    @staticmethod
-    def is_proper_noun(word: str, is_sentence_start: bool = False) -> bool:
-        """
-        Check if a word is likely a proper noun (name, place, etc.).
-        
-        Args:
-            word: The word to check
-            is_sentence_start: Whether this word starts a sentence
-            
-        Returns:
-            True if the word is capitalized and NOT at sentence start
-        """
-        # Don't flag sentence-initial words as proper nouns
-        if is_sentence_start:
-            return False
-        
-        # Check if first letter is uppercase
-        word_clean = word.strip("'\".,;:!?")
-        if not word_clean:
-            return False
-        
-        return word_clean[0].isupper()
-    
-    @staticmethod
-    def is_already_louchebem(word: str) -> bool:
-        """
-        Check if a word looks like it's already in Louchébem form.
-        
-        Louchébem pattern: starts with 'l', ends with typical suffixes.
-        Examples: loucherbem, largonji, laféquès, lombem, etc.
-        
-        Args:
-            word: The word to check
-            
-        Returns:
-            True if word looks like Louchébem
-        """
-        word_lower = word.lower().strip("'\".,;:!?")
-        
-        # Must start with 'l' (but not la/le/les/l')
-        if not word_lower.startswith('l') or len(word_lower) < 4:
-            return False
-        
-        # Skip obvious articles
-        if word_lower in {'le', 'la', 'les', 'leur', 'leurs'}:
-            return False
-        
-        # Check for common Louchébem suffixes
-        louchebem_suffixes = [
-            'em', 'ème', 'é', 'ès', 'esse', 'ok', 'oc', 'oque', 'ic', 'ique',
-            'uche', 'muche', 'puche', 'dem', 'dé', 'tem', 'té', 'vé', 'vem',
-            'sé', 'bé', 'boc', 'fé', 'ji', 'gué', 'ré', 'rré', 'cou', 'mé',
-        ]
-        
-        for suffix in louchebem_suffixes:
-            if word_lower.endswith(suffix):
-                return True
-        
-        return False
+        key = (word, is_sentence_start)
+        cached = self._preserve_cache.get(key)
+        if cached is not None:
+            return cached
 
+        result = self._should_preserve_uncached(word, is_sentence_start)
+        # Bound the cache so pathological inputs can't grow it unchecked
+        if len(self._preserve_cache) < 8192:
+            self._preserve_cache[key] = result
+        return result
 
-# Backwards compatibility: standalone functions that use default config
-_default_rules = None
+    # The predicate implementations live at module level (they take no
+    # self/cls); these staticmethod bindings keep the historical class
+    # API while internal callers use the functions directly.
+    _is_acronym_norm = staticmethod(_is_acronym_norm)
+    _is_already_louchebem_norm = staticmethod(_is_already_louchebem_norm)
+    is_stopword = staticmethod(_is_stopword)
+    is_ultra_common_verb = staticmethod(_is_ultra_common_verb)
+    is_interjection = staticmethod(_is_interjection)
+    is_number_or_date = staticmethod(_is_number_or_date)
+    is_acronym = staticmethod(_is_acronym)
+    is_proper_noun = staticmethod(_is_proper_noun)
+    is_already_louchebem = staticmethod(_is_already_louchebem)
 
 
-def _get_default_rules() -> PreservationRules:
-    """Get or create default preservation rules instance."""
-    global _default_rules
-    if _default_rules is None:
-        from .config import LouchebemConfig
-        _default_rules = PreservationRules(LouchebemConfig())
-    return _default_rules
+@functools.lru_cache(maxsize=None)
+def _compile_preserve_predicate(flags: int):
+    """
+    Compile a should_preserve cascade specialized for one flag set.
 
+    Partial evaluation: the config never changes after construction, so
+    instead of testing `flags & MASK` per category on every call, the
+    cascade is generated with only the enabled branches present — the
+    disabled ones aren't skipped at runtime, they don't exist in the
+    bytecode at all. Normalization steps (lowering, stripping, the
+    first-character gate) are likewise emitted only when some surviving
+    branch consumes them. Cached per flags value, so the handful of
+    distinct configs in a process share compiled predicates.
 
-def should_preserve_word(word: str, is_sentence_start: bool = False) -> bool:
-    """
-    Backwards compatibility: check if word should be preserved using default config.
-    
-    Args:
-        word: The word to check
-        is_sentence_start: Whether this word starts a sentence
-        
     Returns:
-        True if word should be preserved
+        A function (word, is_sentence_start) -> bool
     """
-    return _get_default_rules().should_preserve(word, is_sentence_start)
-
-
-def is_stopword(word: str) -> bool:
-    """Backwards compatibility: check if word is a stopword."""
-    return PreservationRules.is_stopword(word)
-
-
-def is_ultra_common_verb(word: str) -> bool:
-    """Backwards compatibility: check if word is ultra-common verb."""
-    return PreservationRules.is_ultra_common_verb(word)
-
+    gated = flags & _GATED_CATEGORIES
 
-def is_interjection(word: str) -> bool:
-    """Backwards compatibility: check if word is interjection."""
-    return PreservationRules.is_interjection(word)
+    # Merged tag mask for the flat categories the config enables: one
+    # dict probe + one AND covers stopwords, verbs and interjections
+    tag_mask = 0
+    if flags & PRESERVE_STOPWORDS:
+        tag_mask |= _TAG_STOPWORD
+    if flags & PRESERVE_ULTRA_COMMON_VERBS:
+        tag_mask |= _TAG_VERB
+    if flags & PRESERVE_INTERJECTIONS:
+        tag_mask |= _TAG_INTERJECTION
 
+    need_basic = bool(tag_mask or gated & PRESERVE_ALREADY_LOUCHEBEM)
+    need_stripped = bool(gated & (PRESERVE_NUMBERS | PRESERVE_PROPER_NOUNS)
+                         or flags & PRESERVE_ACRONYMS)
 
-def is_number_or_date(word: str) -> bool:
-    """Backwards compatibility: check if word is number/date."""
-    return PreservationRules.is_number_or_date(word)
+    lines = [
+        "def _preserve(word, is_sentence_start):",
+        "    if not word:",
+        "        return False",
+    ]
+    if need_basic or need_stripped:
+        # When both ends are alphabetic (the vast majority of tokens,
+        # since punctuation is split off upstream) every strip below is
+        # a no-op — skip them and reuse the word as-is
+        lines.append("    plain = word[0].isalpha() and word[-1].isalpha()")
+    if need_basic:
+        # Interned probe key: _CATEGORY holds interned strings, so the
+        # dict probe compares by pointer (see the lexicon module)
+        lines.append("    w_basic = _intern(word.lower() if plain"
+                     " else word.lower().strip(_BASIC_STRIP))")
+    if tag_mask:
+        lines += [
+            "    tag = _CATEGORY.get(w_basic, 0)",
+            "    if tag:",
+            f"        if tag & {tag_mask}:",
+            "            return True",
+        ]
+        if tag_mask & _TAG_INTERJECTION:
+            # Interjections additionally shed trailing punctuation
+            # ("chut!"), so retry with the fully stripped form
+            lines += [
+                "    elif not plain:",
+                "        w_full = w_basic.strip(_STRIP_CHARS)",
+                "        if w_full != w_basic and"
+                f" _CATEGORY.get(w_full, 0) & {_TAG_INTERJECTION}:",
+                "            return True",
+            ]
+    if gated:
+        # First-character LUT gate, pre-masked with the enabled
+        # categories: one tuple index rules most words out of numbers /
+        # proper nouns / already-Louchébem
+        lines += [
+            "    cp = ord(word[0])",
+            f"    gate = _FIRST_CHAR_LUT[cp] & {gated} if cp < 256 else {gated}",
+        ]
+    if need_stripped:
+        lines.append("    word_stripped = word if plain else word.strip(_STRIP_CHARS)")
+    if gated & PRESERVE_NUMBERS:
+        lines += [
+            f"    if gate & {PRESERVE_NUMBERS} and _NUMBER_MATCH(word_stripped) is not None:",
+            "        return True",
+        ]
+    if flags & PRESERVE_ACRONYMS:
+        lines += [
+            "    if _is_acronym(word, word_stripped):",
+            "        return True",
+        ]
+    if gated & PRESERVE_PROPER_NOUNS:
+        lines += [
+            f"    if (gate & {PRESERVE_PROPER_NOUNS} and not is_sentence_start",
+            "            and word_stripped and word_stripped[0].isupper()):",
+            "        return True",
+        ]
+    if gated & PRESERVE_ALREADY_LOUCHEBEM:
+        lines += [
+            f"    if gate & {PRESERVE_ALREADY_LOUCHEBEM} and _is_louchebem(",
+            "            w_basic if plain else w_basic.strip(_STRIP_CHARS)):",
+            "        return True",
+        ]
+    lines.append("    return False")
 
+    namespace = {
+        '_CATEGORY': _CATEGORY,
+        '_BASIC_STRIP': "'\"",
+        '_STRIP_CHARS': _STRIP_CHARS,
+        '_FIRST_CHAR_LUT': _FIRST_CHAR_LUT,
+        '_NUMBER_MATCH': _NUMBER_MATCH,
+        '_intern': sys.intern,
+        '_is_acronym': _is_acronym_norm,
+        '_is_louchebem': _is_already_louchebem_norm,
+    }
+    exec('\n'.join(lines), namespace)
+    return namespace['_preserve']
 
-def is_acronym(word: str) -> bool:
-    """Backwards compatibility: check if word is acronym."""
-    return PreservationRules.is_acronym(word)
 
+# Backwards compatibility: standalone functions that use default config.
+# The default-config rules are built eagerly at import (the module already
+# pays for its lexicon imports here, one dataclass more is noise), so the
+# wrapper is the bound method itself — no lazy-init check and no extra
+# Python frame per call.
+_DEFAULT_RULES = PreservationRules(LouchebemConfig())
 
-def is_proper_noun(word: str, is_sentence_start: bool = False) -> bool:
-    """Backwards compatibility: check if word is proper noun."""
-    return PreservationRules.is_proper_noun(word, is_sentence_start)
+should_preserve_word = _DEFAULT_RULES.should_preserve
+"""Backwards compatibility: check if word should be preserved using default config."""
 
 
-def is_already_louchebem(word: str) -> bool:
-    """Backwards compatibility: check if word is already Louchébem."""
-    return PreservationRules.is_already_louchebem(word)
+# The public standalone names alias the module-level predicates
+# directly — no wrapper frame per call
+is_stopword = _is_stopword
+is_ultra_common_verb = _is_ultra_common_verb
+is_interjection = _is_interjection
+is_number_or_date = _is_number_or_date
+is_acronym = _is_acronym
+is_proper_noun = _is_proper_noun
+is_already_louchebem = _is_already_louchebem
 
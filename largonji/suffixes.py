@@ -12,7 +12,14 @@ Key insight: Most suffixes ALREADY contain their consonant!
 This design eliminates consonant doubling at the source.
 """
 
+import array
+import functools
+import itertools
 import random
+import sys
+import zlib
+from collections import namedtuple
+from bisect import bisect
 
 
 # ============================================================================
@@ -257,18 +264,78 @@ NEUTRAL_SUFFIXES = {
     'e', 'i', 'ok', 'o', 'a', 'u'
 }
 
+# Endings that mark a word as (probably) already Louchébem. Includes
+# historical variants ('esse', 'rré', 'cou') beyond the generated tables.
+LOUCHEBEM_ENDINGS = (
+    'em', 'ème', 'é', 'ès', 'esse', 'ok', 'oc', 'oque', 'ic', 'ique',
+    'uche', 'muche', 'puche', 'dem', 'dé', 'tem', 'té', 'vé', 'vem',
+    'sé', 'bé', 'boc', 'fé', 'ji', 'gué', 'ré', 'rré', 'cou', 'mé',
+)
+
+
+# Single merged suffix → consonant table: one dict probe answers both
+# "does this suffix carry a consonant?" and "which one?". Neutral
+# suffixes map to None. Shared 'qu...' suffixes resolve to 'qu' (the
+# letters the suffix actually contains), via definition order below.
+SUFFIX_TO_CONSONANT: dict[str, str | None] = {}
+for _consonant, _pattern in (
+    ('d', D_SUFFIXES), ('s', S_SUFFIXES), ('t', T_SUFFIXES),
+    ('v', V_SUFFIXES), ('p', P_SUFFIXES), ('f', F_SUFFIXES),
+    ('m', M_SUFFIXES), ('n', N_SUFFIXES), ('b', B_SUFFIXES),
+    ('k', K_SUFFIXES), ('c', C_SUFFIXES), ('qu', QU_SUFFIXES),
+    ('g', G_SUFFIXES), ('r', R_SUFFIXES), ('l', L_SUFFIXES),
+    ('z', Z_SUFFIXES), ('j', J_SUFFIXES), ('ch', CH_SUFFIXES),
+):
+    for _suffix in _pattern:
+        SUFFIX_TO_CONSONANT[_suffix] = _consonant
+SUFFIX_TO_CONSONANT.update(dict.fromkeys(NEUTRAL_SUFFIXES))
+del _consonant, _pattern, _suffix
+
+
+def is_louchebem_like(word: str) -> bool:
+    """
+    Check whether a word ends in a typical Louchébem suffix.
+
+    str.endswith with a tuple scans every candidate suffix in one
+    C-level call — no Python-level loop or per-suffix dispatch.
+
+    Args:
+        word: Lowercase word to test
+
+    Returns:
+        True if the word ends in a known Louchébem suffix
+    """
+    return word.endswith(LOUCHEBEM_ENDINGS)
+
+
 def suffix_contains_consonant(suffix: str) -> bool:
     """
     Check if a suffix already contains its consonant.
-    
+
     Args:
         suffix: The suffix string (e.g., 'fok', 'em', 'dé')
-        
+
     Returns:
         False if suffix is neutral (needs consonant prepended)
         True if suffix already contains the consonant
     """
-    return suffix not in NEUTRAL_SUFFIXES
+    # Unknown suffixes fall back on the suffix itself (non-None → True),
+    # matching the old "not in NEUTRAL_SUFFIXES" semantics
+    return SUFFIX_TO_CONSONANT.get(suffix, suffix) is not None
+
+
+def consonant_of(suffix: str) -> str | None:
+    """
+    Get the consonant a suffix already contains, if any.
+
+    Args:
+        suffix: The suffix string (e.g., 'fok', 'em', 'dé')
+
+    Returns:
+        The consonant/cluster the suffix starts with ('f', 'qu', 'ch'...),
+        or None for neutral suffixes
+    """
+    return SUFFIX_TO_CONSONANT.get(suffix)
 
 
 # ============================================================================
@@ -325,131 +392,547 @@ SUFFIX_MAP = {
     'spl': L_SUFFIXES,
 }
 
+# Closed-over resolution table: SUFFIX_MAP plus every ASCII letter not
+# already a key mapped to the default pattern. A known cluster or any
+# single letter now resolves in one dict probe; only unknown multi-char
+# clusters (rare) take the last-consonant retry in get_suffix_pattern.
+RESOLVED_SUFFIX_MAP = dict(SUFFIX_MAP)
+for _ch in 'abcdefghijklmnopqrstuvwxyz':
+    RESOLVED_SUFFIX_MAP.setdefault(_ch, DEFAULT_SUFFIXES)
+del _ch
+
+
+# ============================================================================
+# FLAT STRUCTURE-OF-ARRAYS LAYOUT
+# All suffixes and weights from SUFFIX_MAP packed into two contiguous
+# tuples, CSR-style: _SUFFIX_SPANS maps a cluster to its (start, end)
+# slice. Batch consumers can index the flat arrays directly instead of
+# chasing per-cluster dict objects. Built once at import.
+# ============================================================================
+
+def _build_flat_layout():
+    values: list[str] = []
+    weights: list[float] = []
+    spans: dict[str, tuple[int, int]] = {}
+    for cluster in sorted(SUFFIX_MAP):
+        start = len(values)
+        for suffix, weight in SUFFIX_MAP[cluster].items():
+            values.append(suffix)
+            weights.append(weight)
+        spans[cluster] = (start, len(values))
+    # Default pattern gets the trailing span (no cluster key of its own)
+    start = len(values)
+    for suffix, weight in DEFAULT_SUFFIXES.items():
+        values.append(suffix)
+        weights.append(weight)
+    return tuple(values), tuple(weights), spans, (start, len(values))
+
+
+SUFFIX_VALUES, SUFFIX_WEIGHTS, _SUFFIX_SPANS, _DEFAULT_SPAN = _build_flat_layout()
+
+
+def suffix_span(consonant_cluster: str) -> tuple[int, int]:
+    """
+    Get the (start, end) slice of SUFFIX_VALUES/SUFFIX_WEIGHTS for a cluster.
+
+    Mirrors the fallback chain of get_suffix_pattern: exact cluster,
+    then last consonant, then the default pattern.
+
+    Args:
+        consonant_cluster: The consonant(s) to locate
+
+    Returns:
+        Half-open (start, end) index pair into the flat arrays
+    """
+    cluster_lower = consonant_cluster.lower()
+    span = _SUFFIX_SPANS.get(cluster_lower)
+    if span is None:
+        span = _SUFFIX_SPANS.get(cluster_lower[-1], _DEFAULT_SPAN)
+    return span
+
+
+def _build_alias_table(pattern: dict) -> tuple:
+    """
+    Build a Walker alias table for one pattern dict (Vose's algorithm).
+
+    After O(n) setup, a weighted draw costs exactly two random numbers
+    and one comparison — O(1) regardless of pattern size, with no
+    cumulative-weight search at all.
+
+    Returns:
+        (suffixes, probs, aliases, needs_cons, pairs): suffix tuple,
+        per-slot acceptance probabilities (scaled to n/total), per-slot
+        alias indices, per-slot needs-consonant-prepended flags, and
+        ready-made (suffix, flag) result tuples
+    """
+    suffixes = tuple(sys.intern(s) for s in pattern)
+    n = len(suffixes)
+    total = sum(pattern.values())
+    scaled = [w * n / total for w in pattern.values()]
+
+    probs = [0.0] * n
+    aliases = list(range(n))
+    small = [i for i, w in enumerate(scaled) if w < 1.0]
+    large = [i for i, w in enumerate(scaled) if w >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        probs[s] = scaled[s]
+        aliases[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+    # Leftovers on either worklist are 1.0 up to rounding error
+    for i in small + large:
+        probs[i] = 1.0
+
+    # needs_consonant is a static property of each suffix string, so
+    # resolve it per slot here instead of per draw; the pre-built result
+    # pairs mean a draw returns a shared tuple with zero allocation
+    needs_cons = tuple(s in _SUFFIX_NEEDS_CONSONANT for s in suffixes)
+    pairs = tuple(zip(suffixes, needs_cons))
+    return suffixes, tuple(probs), tuple(aliases), needs_cons, pairs
+
+
+# Every pattern dict, in declaration order — the single source for the
+# derived tables below
+_ALL_PATTERN_DICTS = (D_SUFFIXES, S_SUFFIXES, T_SUFFIXES, V_SUFFIXES,
+                      P_SUFFIXES, F_SUFFIXES, M_SUFFIXES, N_SUFFIXES,
+                      B_SUFFIXES, K_SUFFIXES, C_SUFFIXES, QU_SUFFIXES,
+                      G_SUFFIXES, R_SUFFIXES, L_SUFFIXES, Z_SUFFIXES,
+                      J_SUFFIXES, CH_SUFFIXES, DEFAULT_SUFFIXES)
+
+# Every unique suffix classified once through suffix_contains_consonant:
+# membership here means the suffix is neutral and needs its consonant
+# prepended. Callers test `suffix in _SUFFIX_NEEDS_CONSONANT` — a single
+# C-level set probe — instead of re-running the predicate per element.
+_SUFFIX_NEEDS_CONSONANT = frozenset(
+    s for d in _ALL_PATTERN_DICTS for s in d if not suffix_contains_consonant(s)
+)
+
+# Descriptive name per pattern dict, keyed by id(). The pattern dicts
+# are module globals that live as long as the process, so the id keys
+# are stable; building the map once at import spares classify_consonant
+# a 19-entry dict allocation per call. The names are interned so that
+# downstream equality checks and dict probes can short-circuit on
+# pointer identity.
+_PATTERN_NAMES = {
+    id(D_SUFFIXES): sys.intern('pattern_d'),
+    id(S_SUFFIXES): sys.intern('pattern_s'),
+    id(T_SUFFIXES): sys.intern('pattern_t'),
+    id(V_SUFFIXES): sys.intern('pattern_v'),
+    id(P_SUFFIXES): sys.intern('pattern_p'),
+    id(F_SUFFIXES): sys.intern('pattern_f'),
+    id(M_SUFFIXES): sys.intern('pattern_m'),
+    id(N_SUFFIXES): sys.intern('pattern_n'),
+    id(B_SUFFIXES): sys.intern('pattern_b'),
+    id(K_SUFFIXES): sys.intern('pattern_k'),
+    id(C_SUFFIXES): sys.intern('pattern_c'),
+    id(QU_SUFFIXES): sys.intern('pattern_qu'),
+    id(G_SUFFIXES): sys.intern('pattern_g'),
+    id(R_SUFFIXES): sys.intern('pattern_r'),
+    id(L_SUFFIXES): sys.intern('pattern_l'),
+    id(Z_SUFFIXES): sys.intern('pattern_z'),
+    id(J_SUFFIXES): sys.intern('pattern_j'),
+    id(CH_SUFFIXES): sys.intern('pattern_ch'),
+    id(DEFAULT_SUFFIXES): sys.intern('pattern_default'),
+}
+
+# Precomputed alias tables per pattern dict, built once at import.
+# Keyed by id() since the pattern dicts are module-level constants.
+_ALIAS_TABLES = {id(d): _build_alias_table(d) for d in _ALL_PATTERN_DICTS}
+
+# Expanded sample tables: the declared weights are percentages in
+# disguise (all multiples of 0.01), so each pattern unrolls into ~100
+# slots where result pair i appears round(weight * 100) times. A single
+# uniform choice over the table then draws with the exact declared
+# distribution — no cumulative search, no alias branch. ~1900 shared
+# tuple references across all patterns, negligible memory.
+_SAMPLE_TABLES = {
+    id(d): tuple(
+        pair
+        for pair, w in zip(_ALIAS_TABLES[id(d)][4], d.values())
+        for _ in range(round(w * 100))
+    )
+    for d in _ALL_PATTERN_DICTS
+}
+
+# Immutable read-only view per pattern: suffix tuple, cumulative weights,
+# total weight and pattern name, frozen at import. Readers that only
+# inspect a pattern (classify_consonant, get_suffix_info) pull from the
+# view instead of iterating the dict and re-summing its values; the
+# public SUFFIX_MAP keeps its historical dict-of-weights shape.
+_PatternView = namedtuple('_PatternView', ['suffixes', 'cum', 'total', 'name'])
+
+_PATTERN_VIEWS = {}
+for _d in _ALL_PATTERN_DICTS:
+    _cum = tuple(itertools.accumulate(_d.values()))
+    _PATTERN_VIEWS[id(_d)] = _PatternView(
+        suffixes=_ALIAS_TABLES[id(_d)][0],
+        cum=_cum,
+        total=_cum[-1],
+        name=_PATTERN_NAMES[id(_d)],
+    )
+del _d, _cum
+
+# One-hop cluster resolution: every alias in the resolution table
+# (pr/br/tr/... all pointing at the same pattern) maps straight to its
+# shared view object, so classifying a cluster is a single dict probe
+# instead of the cluster -> pattern dict -> id() -> view chain.
+# SUFFIX_MAP itself keeps its public dict-of-weights values.
+_CLUSTER_TO_VIEW = {
+    cluster: _PATTERN_VIEWS[id(pattern)]
+    for cluster, pattern in RESOLVED_SUFFIX_MAP.items()
+}
+
+# Contiguous CDF over the flat layout: one packed C-double array holds
+# the cumulative weights for every span (restarting at each span start),
+# so a weighted draw bisects a single hot memory region instead of
+# chasing per-cluster tuple objects scattered across the heap.
+def _build_flat_cdf() -> array.array:
+    starts = {start for start, _ in _SUFFIX_SPANS.values()}
+    starts.add(_DEFAULT_SPAN[0])
+    cdf = array.array('d')
+    total = 0.0
+    for i, weight in enumerate(SUFFIX_WEIGHTS):
+        if i in starts:
+            total = 0.0
+        total += weight
+        cdf.append(total)
+    return cdf
+
+
+_SUFFIX_CDF = _build_flat_cdf()
+
+
+def pick_suffix(consonant_cluster: str) -> str:
+    """
+    Draw one weighted-random suffix for a consonant cluster.
+
+    Uses the flat CDF array: one random() call and one range-bounded
+    bisect, mirroring random.choices semantics without its per-call
+    accumulate or any list building.
+
+    Args:
+        consonant_cluster: The consonant(s) moved to the end of the word
+
+    Returns:
+        The selected suffix string
+    """
+    lo, hi = suffix_span(consonant_cluster)
+    # Scale by the span total so slightly-off weight sums stay unbiased
+    r = random.random() * _SUFFIX_CDF[hi - 1]
+    return SUFFIX_VALUES[bisect(_SUFFIX_CDF, r, lo, hi)]
+
+
+def sample_suffixes(consonant_clusters: list[str]) -> list[str]:
+    """
+    Draw one weighted-random suffix for each cluster in a batch.
+
+    Groups the input by distinct cluster, so the span resolution and
+    CDF slicing are paid once per cluster and all draws for a group
+    come from a single random.choices call — per-word overhead drops
+    to scattering results back into place. Real text repeats a few
+    dozen clusters, so the grouping is nearly free.
+
+    Args:
+        consonant_clusters: Clusters moved to word ends, in text order
+
+    Returns:
+        List of suffix strings aligned with the input
+    """
+    groups: dict[str, list[int]] = {}
+    for i, cluster in enumerate(consonant_clusters):
+        group = groups.get(cluster)
+        if group is None:
+            groups[cluster] = [i]
+        else:
+            group.append(i)
+
+    out = [''] * len(consonant_clusters)
+    for cluster, positions in groups.items():
+        lo, hi = suffix_span(cluster)
+        draws = random.choices(SUFFIX_VALUES[lo:hi],
+                               cum_weights=_SUFFIX_CDF[lo:hi],
+                               k=len(positions))
+        for pos, suffix in zip(positions, draws):
+            out[pos] = suffix
+    return out
+
+
+# Highest-weighted suffix per cluster, resolved once at import: callers
+# that want the deterministic "most likely" suffix (tests, examples,
+# reproducible corpus generation) skip sampling and max() entirely.
+TOP_SUFFIX: dict[str, str] = {
+    cluster: max(pattern.items(), key=lambda kv: kv[1])[0]
+    for cluster, pattern in SUFFIX_MAP.items()
+}
+_TOP_DEFAULT = max(DEFAULT_SUFFIXES.items(), key=lambda kv: kv[1])[0]
+
+
+def pick_top_suffix(consonant_cluster: str) -> str:
+    """
+    Get the highest-weighted suffix for a consonant cluster.
+
+    Deterministic counterpart to pick_suffix: constant-time lookup in
+    the precomputed table, with the usual cluster fallback chain.
+
+    Args:
+        consonant_cluster: The consonant(s) moved to the end of the word
+
+    Returns:
+        The most likely suffix string for the cluster
+    """
+    cluster_lower = consonant_cluster.lower()
+    top = TOP_SUFFIX.get(cluster_lower)
+    if top is None:
+        top = TOP_SUFFIX.get(cluster_lower[-1], _TOP_DEFAULT)
+    return top
+
+
+# Single-character dispatch: a 128-byte table mapping an ASCII code point
+# to an index into _PATTERN_BY_INDEX (0 = default pattern). Indexing a
+# bytes object returns a plain int with no object allocation, making
+# this the cheapest possible dispatch for the dominant one-consonant
+# case. Multi-char clusters and non-ASCII fall back to the dict chain.
+_PATTERN_BY_INDEX = (DEFAULT_SUFFIXES,) + tuple(
+    d for d in SUFFIX_MAP.values()
+)
+_SINGLE_CHAR_TABLE = bytes(
+    1 + list(SUFFIX_MAP).index(chr(i).lower()) if chr(i).lower() in SUFFIX_MAP else 0
+    for i in range(128)
+)
+
+
+# Multi-character dispatch: every known cluster is 1-3 ASCII letters, so
+# it packs losslessly into a 24-bit int (c0 | c1<<8 | c2<<16). Small-int
+# keys hash to themselves, so probing this table skips string hashing
+# entirely. Keys are stored pre-lowered; uppercase probes miss and fall
+# back to the string chain.
+def _pack_cluster(raw: bytes) -> int:
+    key = raw[0]
+    if len(raw) > 1:
+        key |= raw[1] << 8
+        if len(raw) > 2:
+            key |= raw[2] << 16
+    return key
+
+
+_CLUSTER_TABLE: dict[int, dict] = {
+    _pack_cluster(cluster.encode()): pattern
+    for cluster, pattern in RESOLVED_SUFFIX_MAP.items()
+    if len(cluster) <= 3
+}
+
+# Memo for deterministic (seeded) selections: the result is a pure
+# function of (cluster, seed), and real text cycles through only a few
+# dozen distinct clusters, so this saturates almost immediately.
+_DETERMINISTIC_CACHE: dict[tuple[str, int], tuple[str, bool]] = {}
+
 
+@functools.lru_cache(maxsize=128)
 def get_suffix_pattern(consonant_cluster: str) -> dict:
     """
     Get the appropriate suffix pattern for a consonant cluster.
-    
+
+    Memoized: real text cycles through a few dozen distinct clusters,
+    so repeats skip normalization and resolution entirely.
+
     Args:
         consonant_cluster: The consonant(s) to find suffixes for
-        
+
     Returns:
         Dictionary of suffix -> weight mappings
     """
-    # Normalize to lowercase
-    cluster_lower = consonant_cluster.lower()
-    
-    # Look up the cluster in SUFFIX_MAP
-    if cluster_lower in SUFFIX_MAP:
-        return SUFFIX_MAP[cluster_lower]
-    
-    # If cluster ends with a known consonant, use that pattern
-    last_char = cluster_lower[-1]
-    if last_char in SUFFIX_MAP:
-        return SUFFIX_MAP[last_char]
-    
-    # Default to DEFAULT_SUFFIXES
-    return DEFAULT_SUFFIXES
-
-
+    # Fast path: single ASCII consonant dispatches through the byte table
+    if len(consonant_cluster) == 1:
+        o = ord(consonant_cluster)
+        if o < 128:
+            return _PATTERN_BY_INDEX[_SINGLE_CHAR_TABLE[o]]
+
+    # Probe with the raw cluster first: internally-generated clusters are
+    # already lowercase ASCII, so the common case packs into a small-int
+    # key (int hashing is free) and never allocates a lowered copy
+    if consonant_cluster.isascii() and len(consonant_cluster) <= 3:
+        raw = consonant_cluster.encode()
+        pattern = _CLUSTER_TABLE.get(_pack_cluster(raw))
+        if pattern is not None:
+            return pattern
+        if consonant_cluster.islower():
+            # Unknown lowercase ASCII cluster: its last consonant is a
+            # single byte, so retry through the single-char byte table
+            return _PATTERN_BY_INDEX[_SINGLE_CHAR_TABLE[raw[-1]]]
+    pattern = RESOLVED_SUFFIX_MAP.get(consonant_cluster)
+    if pattern is not None:
+        return pattern
+    cluster_lower = consonant_cluster if consonant_cluster.islower() else consonant_cluster.lower()
+
+    # One probe against the closed resolution table; only unknown
+    # multi-char clusters miss and retry on their last consonant
+    pattern = RESOLVED_SUFFIX_MAP.get(cluster_lower)
+    if pattern is None:
+        pattern = RESOLVED_SUFFIX_MAP.get(cluster_lower[-1], DEFAULT_SUFFIXES)
+    return pattern
+
+
+@functools.lru_cache(maxsize=128)
 def classify_consonant(consonant_cluster: str) -> str:
     """
     Get a descriptive name for the consonant pattern.
-    
+
+    Memoized alongside get_suffix_pattern for the same reason: the
+    distinct-cluster population is tiny.
+
     Args:
         consonant_cluster: The consonant(s) to classify
-        
+
     Returns:
         Pattern name (e.g., 'pattern_f', 'pattern_d')
     """
     cluster_lower = consonant_cluster.lower()
-    
-    # Check if we have a direct mapping
-    if cluster_lower in SUFFIX_MAP:
-        # Get the pattern name from the suffix dict
-        suffix_dict = SUFFIX_MAP[cluster_lower]
-        
-        # Map each suffix dict to a pattern name
-        pattern_names = {
-            id(D_SUFFIXES): 'pattern_d',
-            id(S_SUFFIXES): 'pattern_s',
-            id(T_SUFFIXES): 'pattern_t',
-            id(V_SUFFIXES): 'pattern_v',
-            id(P_SUFFIXES): 'pattern_p',
-            id(F_SUFFIXES): 'pattern_f',
-            id(M_SUFFIXES): 'pattern_m',
-            id(N_SUFFIXES): 'pattern_n',
-            id(B_SUFFIXES): 'pattern_b',
-            id(K_SUFFIXES): 'pattern_k',
-            id(C_SUFFIXES): 'pattern_c',
-            id(QU_SUFFIXES): 'pattern_qu',
-            id(G_SUFFIXES): 'pattern_g',
-            id(R_SUFFIXES): 'pattern_r',
-            id(L_SUFFIXES): 'pattern_l',
-            id(Z_SUFFIXES): 'pattern_z',
-            id(J_SUFFIXES): 'pattern_j',
-            id(CH_SUFFIXES): 'pattern_ch',
-            id(DEFAULT_SUFFIXES): 'pattern_default',
-        }
-        
-        return pattern_names.get(id(suffix_dict), 'pattern_unknown')
-    
-    return 'pattern_default'
 
+    # Aliases were flattened into the view table at import, so known
+    # clusters resolve to their name in one probe; everything else
+    # (including clusters only reachable via the last-consonant
+    # fallback) is the default pattern
+    view = _CLUSTER_TO_VIEW.get(cluster_lower)
+    return view.name if view is not None else 'pattern_default'
 
-def select_suffix(consonant_cluster: str, seed: int | None = None) -> tuple[str, bool]:
+
+def classify_consonant_batch(consonant_clusters: list[str]) -> list[str]:
+    """
+    Classify a whole batch of consonant clusters in one call.
+
+    Repeated clusters (very common in real text: 's', 'r', 'l', 'pr'...)
+    are classified once and served from a local memo, so the per-call
+    dispatch cost is paid per distinct cluster rather than per token.
+
+    Args:
+        consonant_clusters: Sequence of consonant clusters to classify
+
+    Returns:
+        List of pattern names, aligned with the input
+    """
+    memo: dict[str, str] = {}
+    result = []
+    for cluster in consonant_clusters:
+        name = memo.get(cluster)
+        if name is None:
+            name = classify_consonant(cluster)
+            memo[cluster] = name
+        result.append(name)
+    return result
+
+
+def select_suffix(
+    consonant_cluster: str,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> tuple[str, bool]:
     """
     Select a suffix based on the consonant cluster using weighted random choice.
-    
+
     Follows traditional louchébem patterns where suffixes are chosen based on
     the final consonant sound for phonetic harmony.
-    
+
+    Neither mode ever reseeds the shared module PRNG: seeded calls hash
+    (cluster, seed) instead, and callers who need an isolated stream can
+    pass their own random.Random instance.
+
     Args:
         consonant_cluster: The consonant(s) moved to the end of the word
         seed: Optional random seed for deterministic output (useful for testing)
-        
+        rng: Optional random.Random instance to draw from instead of the
+            module PRNG (ignored in seeded mode, which is hash-driven)
+
     Returns:
         Tuple of (suffix_string, needs_consonant_prepended)
         - suffix_string: The suffix to add (e.g., 'fok', 'em', 'dé')
         - needs_consonant_prepended: True if consonant should be added before suffix
     """
+    if seed is not None:
+        # Deterministic mode: the answer is a pure function of
+        # (cluster, seed), so serve repeats straight from the memo
+        key = (consonant_cluster, seed)
+        cached = _DETERMINISTIC_CACHE.get(key)
+        if cached is not None:
+            return cached
+
     # Get the appropriate suffix pattern
     suffix_weights = get_suffix_pattern(consonant_cluster)
-    
-    # Set seed if provided (for testing/reproducibility)
+
     if seed is not None:
-        random.seed(seed)
-    
-    # Weighted random choice
-    suffixes = list(suffix_weights.keys())
-    weights = list(suffix_weights.values())
-    
-    selected_suffix = random.choices(suffixes, weights=weights, k=1)[0]
-    
-    # Check if this suffix needs the consonant prepended
-    needs_consonant = not suffix_contains_consonant(selected_suffix)
-    
-    return (selected_suffix, needs_consonant)
+        # Index the precomputed table with a cheap, stable hash of
+        # (cluster, seed). Same cluster + same seed always yields the
+        # same suffix, without reseeding (and advancing) the global
+        # Mersenne Twister on every call.
+        suffixes, _, _, _, pairs = _ALIAS_TABLES[id(suffix_weights)]
+        i = (zlib.crc32(consonant_cluster.lower().encode('utf-8')) ^ seed) % len(suffixes)
+        result = pairs[i]
+        _DETERMINISTIC_CACHE[key] = result
+        return result
+
+    # Single uniform choice over the expanded table: each result pair
+    # appears in proportion to its weight, so the draw distribution is
+    # exact and there is no cumulative-weight search per call
+    if rng is None:
+        rng = random
+    return rng.choice(_SAMPLE_TABLES[id(suffix_weights)])
+
+
+def select_suffixes_batch(consonant_clusters: list[str]) -> list[tuple[str, bool]]:
+    """
+    Select one (suffix, needs_consonant) pair per cluster in a batch.
+
+    Groups the input by resolved pattern, so pattern resolution and
+    alias-table unpacking happen once per distinct pattern; the draws
+    themselves run in a tight loop over pre-bound locals. Results come
+    back aligned with the input order.
+
+    Args:
+        consonant_clusters: Clusters moved to word ends, in text order
+
+    Returns:
+        List of (suffix_string, needs_consonant_prepended) tuples
+    """
+    groups: dict[int, list[int]] = {}
+    for i, cluster in enumerate(consonant_clusters):
+        pid = id(get_suffix_pattern(cluster))
+        group = groups.get(pid)
+        if group is None:
+            groups[pid] = [i]
+        else:
+            group.append(i)
+
+    out: list = [None] * len(consonant_clusters)
+    rand = random.random
+    for pid, positions in groups.items():
+        suffixes, probs, aliases, _, pairs = _ALIAS_TABLES[pid]
+        n = len(suffixes)
+        for pos in positions:
+            i = int(rand() * n)
+            if rand() >= probs[i]:
+                i = aliases[i]
+            out[pos] = pairs[i]
+    return out
+
+
+# The union of every pattern's suffixes is static; compute and sort it
+# exactly once at import
+_ALL_SUFFIXES = tuple(sorted({s for d in _ALL_PATTERN_DICTS for s in d}))
 
 
 def get_all_suffixes() -> list[str]:
     """
     Get a list of all possible suffixes across all patterns.
-    
+
     Returns:
         Sorted list of unique suffix strings
     """
-    all_suffixes = set()
-    
-    # Collect from all suffix dictionaries
-    for suffix_dict in [D_SUFFIXES, S_SUFFIXES, T_SUFFIXES, V_SUFFIXES, 
-                        P_SUFFIXES, F_SUFFIXES, M_SUFFIXES, N_SUFFIXES,
-                        B_SUFFIXES, K_SUFFIXES, C_SUFFIXES, QU_SUFFIXES,
-                        G_SUFFIXES, R_SUFFIXES, L_SUFFIXES, Z_SUFFIXES,
-                        J_SUFFIXES, CH_SUFFIXES, DEFAULT_SUFFIXES]:
-        all_suffixes.update(suffix_dict.keys())
-    
-    return sorted(all_suffixes)
+    # Fresh list per call so callers can mutate their copy freely
+    return list(_ALL_SUFFIXES)
 
 
 def get_suffix_info(consonant_cluster: str) -> dict:
@@ -464,13 +947,18 @@ def get_suffix_info(consonant_cluster: str) -> dict:
     Returns:
         Dictionary with suffix information
     """
+    # Resolve once: the view already carries the pattern's name, so a
+    # separate classify_consonant call (which redoes the same cluster
+    # lookup) is unnecessary. Clusters resolved through the last-consonant
+    # fallback report the pattern they actually draw from.
     pattern = get_suffix_pattern(consonant_cluster)
-    pattern_name = classify_consonant(consonant_cluster)
-    
+    view = _PATTERN_VIEWS[id(pattern)]
+
     return {
         'consonant_cluster': consonant_cluster,
-        'pattern_name': pattern_name,
-        'available_suffixes': list(pattern.keys()),
+        'pattern_name': view.name,
+        # Shared immutable tuple — no per-call list copy
+        'available_suffixes': view.suffixes,
         'weights': pattern,
-        'total_weight': sum(pattern.values()),
+        'total_weight': view.total,
     }
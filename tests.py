@@ -5,9 +5,37 @@ Tests the converter against examples from the plan and validates
 the hybrid approach.
 """
 
-from largonji import LouchebemConverter, convert
+from largonji import LEXICON_TRIE, STOPWORD_TRIE, LouchebemConverter, convert, convert_batch
 from largonji.lexicon import ESTABLISHED_LEXICON
-from largonji.suffixes import classify_consonant, get_suffix_info
+from largonji.suffixes import (
+    TOP_SUFFIX,
+    classify_consonant,
+    classify_consonant_batch,
+    consonant_of,
+    get_suffix_info,
+    get_suffix_pattern,
+    pick_suffix,
+    sample_suffixes,
+    select_suffixes_batch,
+    suffix_contains_consonant,
+    suffix_span,
+)
+
+
+# Converter construction (lexicon load, suffix tables, preservation
+# rules) is the dominant per-test setup cost, and converters hold no
+# state between calls beyond internal memo caches. Tests therefore
+# share one instance per distinct configuration.
+_CONVERTER_CACHE: dict[tuple, LouchebemConverter] = {}
+
+
+def get_converter(**kwargs) -> LouchebemConverter:
+    """Return a shared converter for the given constructor kwargs."""
+    key = tuple(sorted(kwargs.items()))
+    converter = _CONVERTER_CACHE.get(key)
+    if converter is None:
+        converter = _CONVERTER_CACHE[key] = LouchebemConverter(**kwargs)
+    return converter
 
 
 def test_dictionary_words():
@@ -16,7 +44,7 @@ def test_dictionary_words():
     print("TEST: Dictionary Words")
     print("=" * 60)
     
-    converter = LouchebemConverter()
+    converter = get_converter()
     
     # Test cases from the plan (section 3.1)
     test_cases = {
@@ -60,7 +88,7 @@ def test_consonant_clusters():
     print("TEST: Consonant Clusters")
     print("=" * 60)
     
-    converter = LouchebemConverter(random_seed=42)
+    converter = get_converter(random_seed=42)
     
     # Examples from plan section 2.1
     test_cases = [
@@ -102,7 +130,7 @@ def test_stopwords():
     print("TEST: Stopword Preservation")
     print("=" * 60)
     
-    converter = LouchebemConverter(preserve_stopwords=True)
+    converter = get_converter(preserve_stopwords=True)
     
     stopwords = ['le', 'la', 'les', 'de', 'un', 'une', 'et', 'à', 'du']
     
@@ -133,7 +161,7 @@ def test_vowel_initial_words():
     print("TEST: Vowel-Initial Words (attack consonant)")
     print("=" * 60)
     
-    converter = LouchebemConverter(random_seed=42)
+    converter = get_converter(random_seed=42)
     
     # Vowel-initial words should find attack consonant and transform
     test_cases = [
@@ -171,7 +199,7 @@ def test_l_initial_words():
     print("TEST: L-Initial Words (transform)")
     print("=" * 60)
     
-    converter = LouchebemConverter(random_seed=42)
+    converter = get_converter(random_seed=42)
     
     # L-initial words should be transformed: l + rest → l + rest + l + suffix
     # Note: doubled 'll' is simplified to 'l' by the doubled consonant fix
@@ -209,7 +237,7 @@ def test_phrases():
     print("TEST: Full Phrases")
     print("=" * 60)
     
-    converter = LouchebemConverter()
+    converter = get_converter()
     
     # Test phrase from plan section 8
     phrase = "Bonjour monsieur le boucher"
@@ -245,7 +273,7 @@ def test_case_preservation():
     print("TEST: Case Preservation")
     print("=" * 60)
     
-    converter = LouchebemConverter(preserve_case=True)
+    converter = get_converter(preserve_case=True)
     
     test_cases = [
         ('boucher', 'lowercase'),
@@ -330,7 +358,7 @@ def test_conversion_modes():
     text = "boucher robot"  # "boucher" in dict, "robot" not in dict
     
     # Hybrid mode: dictionary words preserved, unknown words transformed
-    converter = LouchebemConverter(random_seed=42)
+    converter = get_converter(random_seed=42)
     result = converter.convert_text(text)
     print(f"Input:  {text}")
     print(f"Output: {result}")
@@ -345,10 +373,95 @@ def test_conversion_modes():
     print(f"{'✓' if algo_ok else '✗'} Unknown word 'robot' transformed: {algo_ok}")
     
     print()
-    
+
     return dict_ok and algo_ok
 
 
+def test_batch_api():
+    """Test convert_batch alignment and convert_text statistics"""
+    print("=" * 60)
+    print("TEST: Batch API and Conversion Stats")
+    print("=" * 60)
+
+    words = ['boucher', 'sac', 'le', 'boucher']
+    batch = convert_batch(words)
+    print(f"Input:  {words}")
+    print(f"Output: {batch}")
+    print()
+
+    converter = get_converter()
+    _, stats = converter.convert_text('Le boucher vend le sac.', return_stats=True)
+    _, empty_stats = converter.convert_text('', return_stats=True)
+
+    checks = {
+        'Batch output aligned with input': len(batch) == len(words),
+        "Dictionary word 'boucher' → 'loucherbem'": batch[0] == 'loucherbem',
+        "Stopword 'le' preserved": batch[2] == 'le',
+        'Repeated word converts identically': batch[0] == batch[3],
+        'Stats count every word': stats['words'] == 5,
+        'Stats see the preserved stopwords': stats['preserved'] >= 2,
+        'Stats see the dictionary hits': stats['dict_hits'] >= 2,
+        'Stats counts stay within word total':
+            stats['preserved'] + stats['transformed'] <= stats['words'],
+        'Empty text yields zeroed stats': empty_stats['words'] == 0,
+    }
+
+    passed = 0
+    for check, ok in checks.items():
+        symbol = "✓" if ok else "✗"
+        print(f"{symbol} {check}")
+        if ok:
+            passed += 1
+
+    print(f"\nPassed: {passed}/{len(checks)}")
+    print()
+
+    return passed == len(checks)
+
+
+def test_suffix_helpers():
+    """Smoke-test the suffix sampling and classification helpers"""
+    print("=" * 60)
+    print("TEST: Suffix Helpers")
+    print("=" * 60)
+
+    single = pick_suffix('b')
+    sampled = sample_suffixes(['b', 'r', 'b'])
+    pairs = select_suffixes_batch(['f', 'pr', 'f'])
+    names = classify_consonant_batch(['b', 'pr', 'x'])
+
+    checks = {
+        'pick_suffix draws from the pattern': single in get_suffix_pattern('b'),
+        'sample_suffixes aligns with input': len(sampled) == 3
+            and all(s in get_suffix_pattern(c) for s, c in zip(sampled, ['b', 'r', 'b'])),
+        'select_suffixes_batch aligns with input': len(pairs) == 3,
+        'Batch flags match suffix_contains_consonant':
+            all(flag == (not suffix_contains_consonant(s)) for s, flag in pairs),
+        'classify_consonant_batch matches singles':
+            names == [classify_consonant(c) for c in ['b', 'pr', 'x']],
+        "consonant_of reads the embedded consonant": consonant_of('fok') == 'f',
+        'consonant_of is None for neutral suffixes': consonant_of('em') is None,
+        'suffix_span bounds are a real slice':
+            suffix_span('b')[0] < suffix_span('b')[1],
+        'TOP_SUFFIX agrees with the heaviest weight':
+            TOP_SUFFIX['b'] == max(get_suffix_pattern('b'), key=get_suffix_pattern('b').get),
+        'Lexicon trie export knows its words': 'boucher' in LEXICON_TRIE,
+        'Stopword trie export knows its words': 'le' in STOPWORD_TRIE,
+    }
+
+    passed = 0
+    for check, ok in checks.items():
+        symbol = "✓" if ok else "✗"
+        print(f"{symbol} {check}")
+        if ok:
+            passed += 1
+
+    print(f"\nPassed: {passed}/{len(checks)}")
+    print()
+
+    return passed == len(checks)
+
+
 def run_all_tests():
     """Run all test suites"""
     print("\n")
@@ -367,6 +480,8 @@ def run_all_tests():
         ("Case Preservation", test_case_preservation),
         ("Suffix Organization", test_suffix_organization),
         ("Conversion Modes", test_conversion_modes),
+        ("Batch API and Stats", test_batch_api),
+        ("Suffix Helpers", test_suffix_helpers),
     ]
     
     results = []